@@ -0,0 +1,193 @@
+"""HTTP API serving the app's pipeline as data.
+
+    python api.py [--host 0.0.0.0] [--port 8000]
+
+    GET /health
+    GET /v1/prices/{symbol}        daily bars
+    GET /v1/predictions/{symbol}   predicted vs actual close over the test span
+    GET /v1/signals/{symbol}       close, MA100/MA200 and trend per bar,
+                                   plus the latest golden/death cross
+
+Every data endpoint takes ``?tail=N`` (latest N rows; signals default to 1)
+and answers JSON, or an Arrow IPC stream with ``?format=arrow`` or
+``Accept: application/vnd.apache.arrow.stream``.
+
+The same stages app.py runs: bars come from the shared OHLCV cache and the
+rate-limited fetch scheduler, predictions from the shared model registry
+and prediction store (``PREDICTOR_*`` settings apply as for the app). The
+server is asyncio; CPU-bound stages run on a thread pool so the loop keeps
+accepting requests, and concurrent requests for the same data share one
+fetch and one model run.
+
+Alpha Vantage calls come out of the API's own share of the plan,
+``ALPHA_VANTAGE_API_CALLS_PER_MINUTE``, which must be set; the app keeps the
+rest of ``ALPHA_VANTAGE_CALLS_PER_MINUTE``.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+from aiohttp import web
+
+from predictor.config import (ALPHA_VANTAGE_BASE_URL, ALPHA_VANTAGE_CALLS_PER_MINUTE,
+                              API_CALLS_PER_MINUTE)
+from predictor.fetch import FetchScheduler, ThrottledError, UnknownSymbolError
+from predictor.ohlcv_cache import load_daily, ticker_key
+from predictor.pipeline import moving_averages
+from predictor.registry import get_bundle, get_model, preload
+from predictor.service import last_crossover, predict_test_span, signal_frame
+from predictor.session import data_key
+from predictor.singleflight import flights
+
+ARROW = 'application/vnd.apache.arrow.stream'
+
+
+# ------------------ Responses ------------------ #
+
+def wants_arrow(request):
+    return request.query.get('format') == 'arrow' or ARROW in request.headers.get('Accept', '')
+
+
+def respond(request, frame, **meta):
+    """``frame`` (index becomes the first column) as JSON records or Arrow."""
+    frame = frame.reset_index()
+    if wants_arrow(request):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b'predictor': json.dumps(meta, default=str).encode()})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return web.Response(body=sink.getvalue().to_pybytes(), content_type=ARROW)
+    body = json.dumps({**meta, 'data': json.loads(frame.to_json(orient='records',
+                                                                 date_format='iso'))},
+                      default=str)
+    return web.Response(text=body, content_type='application/json')
+
+
+def error(http_error, message, **headers):
+    """An aiohttp HTTP exception carrying a JSON ``{"error": message}`` body."""
+    return http_error(text=json.dumps({'error': message}), content_type='application/json',
+                      headers=headers)
+
+
+def tail(request, frame, default=None):
+    n = request.query.get('tail', default)
+    if n is None:
+        return frame
+    try:
+        n = int(n)
+    except ValueError:
+        raise error(web.HTTPBadRequest, f'tail must be an integer, got {n!r}')
+    if n < 0:
+        raise error(web.HTTPBadRequest, f'tail must not be negative, got {n}')
+    return frame.tail(n)
+
+
+# ------------------ Pipeline ------------------ #
+
+async def load_frame(request):
+    symbol = request.match_info['symbol']
+    scheduler = request.app['scheduler']
+    try:
+        df = await flights.do_async(('fetch', ticker_key(symbol)), load_daily, symbol,
+                                    scheduler.api_key, fetcher=scheduler.fetch)
+    except ThrottledError:
+        raise error(web.HTTPServiceUnavailable, 'Alpha Vantage rate limit reached', **{'Retry-After': '60'})
+    except UnknownSymbolError as e:
+        raise error(web.HTTPNotFound, str(e))
+    except ValueError as e:
+        # Anything else Alpha Vantage refused (bad key, premium endpoint, empty reply)
+        raise error(web.HTTPBadGateway, str(e))
+    if df is None or df.empty:
+        raise error(web.HTTPNotFound, f'No data for {symbol}')
+    return symbol, df
+
+
+async def in_executor(fn, *args, **kwargs):
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+def predict(symbol, df):
+    bundle = get_bundle()
+    model = get_model(bundle.model_path)
+    return predict_test_span(model, bundle, symbol, df['Close'], data_key(symbol, df))
+
+
+def signals(symbol, df):
+    key = ('indicators',) + data_key(symbol, df)
+    ma100, ma200 = flights.do(key, moving_averages, df['Close'])
+    return signal_frame(df['Close'], ma100, ma200), last_crossover(ma100, ma200)
+
+
+# ------------------ Handlers ------------------ #
+
+async def health(request):
+    return web.json_response({'status': 'ok'})
+
+
+async def prices(request):
+    symbol, df = await load_frame(request)
+    return respond(request, tail(request, df), symbol=ticker_key(symbol), bars=len(df))
+
+
+async def predictions(request):
+    symbol, df = await load_frame(request)
+    result = await in_executor(predict, symbol, df)
+    frame = pd.DataFrame({'actual': result.actual, 'predicted': result.predicted},
+                         index=pd.Index(result.dates, name='date'))
+    return respond(request, tail(request, frame), symbol=ticker_key(symbol), model=result.model_key)
+
+
+async def signals_handler(request):
+    symbol, df = await load_frame(request)
+    frame, crossover = await in_executor(signals, symbol, df)
+    crossover = crossover and {'date': crossover[0].date().isoformat(), 'kind': crossover[1]}
+    return respond(request, tail(request, frame, default=1), symbol=ticker_key(symbol),
+                   last_crossover=crossover)
+
+
+# ------------------ App ------------------ #
+
+def make_app(api_key):
+    async def start(app):
+        # Its own share of the plan; the app's scheduler uses the rest
+        app['scheduler'] = await FetchScheduler(api_key, calls_per_minute=API_CALLS_PER_MINUTE).start()
+        # Load and warm the model before the first prediction request needs it
+        preload(get_bundle().model_path)
+
+    async def stop(app):
+        await app['scheduler'].close()
+
+    app = web.Application()
+    app.on_startup.append(start)
+    app.on_cleanup.append(stop)
+    app.router.add_get('/health', health)
+    app.router.add_get('/v1/prices/{symbol}', prices)
+    app.router.add_get('/v1/predictions/{symbol}', predictions)
+    app.router.add_get('/v1/signals/{symbol}', signals_handler)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8000)))
+    args = parser.parse_args()
+
+    api_key = os.environ.get('ALPHA_VANTAGE_API_KEY') or (ALPHA_VANTAGE_BASE_URL and 'offline')
+    if not api_key:
+        raise SystemExit('Set ALPHA_VANTAGE_API_KEY (see README) or ALPHA_VANTAGE_BASE_URL')
+    if not 0 < API_CALLS_PER_MINUTE < ALPHA_VANTAGE_CALLS_PER_MINUTE:
+        raise SystemExit(f'Set ALPHA_VANTAGE_API_CALLS_PER_MINUTE to the API\'s share of the '
+                         f'plan\'s {ALPHA_VANTAGE_CALLS_PER_MINUTE:g} calls per minute (above 0 '
+                         f'and below the plan; the app gets the rest)')
+    web.run_app(make_app(api_key), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,26 @@
-import numpy as np
 import pandas as pd
-from alpha_vantage.async_support.timeseries import TimeSeries
-from keras.models import load_model
 import streamlit as st
-import matplotlib.pyplot as plt
 import datetime
-from sklearn.preprocessing import MinMaxScaler
 import asyncio
 import os
 from os import environ
 
+from predictor.config import ALPHA_VANTAGE_BASE_URL, CHART_BACKEND, QUANTIZATION
+from predictor.fetch import shared_scheduler
+from predictor.ohlcv_cache import load_daily, ticker_key
+from predictor.pipeline import moving_averages
+from predictor.registry import get_bundle, get_model, preload
+from predictor.service import predict_test_span, trend_signal
+from predictor.session import TickerSession
+from predictor.singleflight import flights
+from predictor.timing import StageTimer
+
 # ------------------ API Key Check ------------------ #
 def check_api_key():
     api_key = os.environ.get("ALPHA_VANTAGE_API_KEY")
+    if not api_key and ALPHA_VANTAGE_BASE_URL:
+        # A stand-in server such as tools/av_stub.py accepts any key
+        return "offline"
     if not api_key:
         st.error("""
         ⚠️ Alpha Vantage API key not found! Please follow these steps:
@@ -158,94 +166,98 @@ st.title('📈 Stock Price Predictor')
 ticker = st.text_input('Enter Stock Symbol (e.g. AAPL, GOOGL, TSLA)', 'AAPL')
 
 async def get_stock_data(symbol):
-    # Initialize Alpha Vantage API
-    ts = TimeSeries(key=api_key, output_format='pandas')
     try:
-        # Fetch stock data from Alpha Vantage
-        data, meta_data = await ts.get_daily(symbol=symbol, outputsize='full')
-        await ts.close()  # Close the session
-        # Rename columns to match our previous format
-        data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        # Sort index to ascending order
-        return data.sort_index(ascending=True)
+        # Served from the local OHLCV cache; only new bars hit Alpha Vantage,
+        # through the server-wide rate-limited scheduler
+        # Concurrent sessions asking for the same ticker share one fetch
+        scheduler = shared_scheduler(api_key)
+        return await flights.do_async(('fetch', ticker_key(symbol)), load_daily, symbol, api_key,
+                                      fetcher=scheduler.fetch_threadsafe)
     except Exception as e:
         st.error(f"Error fetching stock data: {e}")
         return None
 
-# Use asyncio to run the async function
+# The fetched frame and everything computed from it live in session state,
+# so reruns from other widgets neither refetch nor re-predict
+session = TickerSession(st.session_state)
 
-df = None
+# Wall-clock spans for each stage of this run, shown in the Performance panel
+# at the bottom of the page and logged as JSON lines
+timer = StageTimer(ticker=ticker_key(ticker))
 
+# Use asyncio to run the async function
 if st.button("Fetch Stock Data"):
     if ticker.strip() == "":
         st.warning("Please enter a stock symbol.")
     else:
-        df = asyncio.run(get_stock_data(ticker))
+        with timer.span('fetch'):
+            fetched = asyncio.run(get_stock_data(ticker))
 
-        if df is None or df.empty:
+        if fetched is None or fetched.empty:
             st.error("No data found for this stock symbol.")
             st.stop()
+        session.store(ticker, fetched)
+
+df = session.frame(ticker)
+if df is None:
+    st.info("Enter a stock symbol and press **Fetch Stock Data** to load its history.")
+    st.stop()
 
 # Data Overview
 st.subheader('Stock Data Overview')
-st.write(df.describe())
+with timer.span('describe'):
+    st.write(df.describe())
 
-# Plot closing price
-def plot_chart(title, *args):
-    fig = plt.figure(figsize=(12,6))
-    for data in args:
-        plt.plot(data)
-    plt.title(title)
-    plt.xlabel('Date')
-    plt.ylabel('Price')
-    st.pyplot(fig)
+# Heavy dependencies load only from here on, after the first paint. The model
+# loads and warms in the background (shared by every session of this server
+# process) while the charts render.
+bundle = get_bundle()
+preload(bundle.model_path)
 
+if CHART_BACKEND == 'plotly':
+    from predictor import plotly_charts as charts
+else:
+    from predictor import charts
+    from predictor.render_cache import chart_key, render_cache
+
+data_key = session.data_key
+
+# Charts are rasterized once per (data, chart type, size) and then served
+# from the shared render cache on every rerun and session. Plotly charts are
+# drawn by the browser, so there is nothing to rasterize or cache here.
+def show_chart(chart, draw, *extra):
+    if CHART_BACKEND == 'plotly':
+        with timer.span(f'chart:{chart}'):
+            st.plotly_chart(draw(), use_container_width=True)
+        return
+    key = chart_key(data_key, chart, charts.FIGSIZE, *extra)
+    with timer.span(f'chart:{chart}'):
+        st.image(render_cache.render(key, draw), use_column_width=True)
+
+# Plot closing price
 st.subheader('📉 Closing Price Over Time')
-plot_chart('Closing Price', df['Close'])
+show_chart('close', lambda: charts.line_chart('Closing Price', df['Close']))
 
 # Moving Averages
-ma100 = df['Close'].rolling(100).mean()
-ma200 = df['Close'].rolling(200).mean()
+with timer.span('indicators'):
+    ma100, ma200 = session.memo('indicators', flights.do, ('indicators',) + data_key,
+                                moving_averages, df['Close'])
 
 # Plot 100-day Moving Average
 st.subheader('📊 Closing Price with 100-Day Moving Average')
-fig_ma100 = plt.figure(figsize=(12,6))
-plt.plot(df['Close'], label='Closing Price', alpha=0.8)
-plt.plot(ma100, label='100-Day MA', color='red', linewidth=2)
-plt.title('100-Day Moving Average vs Closing Price')
-plt.xlabel('Date')
-plt.ylabel('Price ($)')
-plt.ylim(0, 1550)  # Set y-axis range
-plt.legend()
-plt.grid(True, alpha=0.3)
-st.pyplot(fig_ma100)
+show_chart('ma100', lambda: charts.moving_average_chart(
+    df['Close'], '100-Day Moving Average vs Closing Price', [(ma100, '100-Day MA', 'red')]))
 
 # Plot 200-day Moving Average
 st.subheader('📊 Closing Price with 200-Day Moving Average')
-fig_ma200 = plt.figure(figsize=(12,6))
-plt.plot(df['Close'], label='Closing Price', alpha=0.8)
-plt.plot(ma200, label='200-Day MA', color='blue', linewidth=2)
-plt.title('200-Day Moving Average vs Closing Price')
-plt.xlabel('Date')
-plt.ylabel('Price ($)')
-plt.ylim(0, 1550)  # Set y-axis range
-plt.legend()
-plt.grid(True, alpha=0.3)
-st.pyplot(fig_ma200)
+show_chart('ma200', lambda: charts.moving_average_chart(
+    df['Close'], '200-Day Moving Average vs Closing Price', [(ma200, '200-Day MA', 'blue')]))
 
 # Combined Moving Averages Plot
 st.subheader('📊 Combined Moving Averages Analysis')
-fig_combined = plt.figure(figsize=(12,6))
-plt.plot(df['Close'], label='Closing Price', alpha=0.6)
-plt.plot(ma100, label='100-Day MA', color='red', linewidth=2)
-plt.plot(ma200, label='200-Day MA', color='blue', linewidth=2)
-plt.title('Combined Moving Averages Analysis')
-plt.xlabel('Date')
-plt.ylabel('Price ($)')
-plt.ylim(0, 1550)  # Set y-axis range
-plt.legend()
-plt.grid(True, alpha=0.3)
-st.pyplot(fig_combined)
+show_chart('ma_combined', lambda: charts.moving_average_chart(
+    df['Close'], 'Combined Moving Averages Analysis',
+    [(ma100, '100-Day MA', 'red'), (ma200, '200-Day MA', 'blue')], close_alpha=0.6))
 
 # Add Moving Average Crossover Analysis
 st.subheader('Moving Average Crossover Analysis')
@@ -271,59 +283,33 @@ with col3:
     st.metric("200-Day MA", f"${current_ma200:.2f}")
 
 # Market Position Analysis
-if current_ma100 > current_ma200:
-    if current_price > current_ma100:
-        st.success("Strong Uptrend: Price is above both moving averages, and 100-day MA is above 200-day MA")
-    else:
-        st.info("Potential Uptrend: 100-day MA is above 200-day MA, but price is below 100-day MA")
+trend = trend_signal(current_price, current_ma100, current_ma200)
+if trend == 'strong_uptrend':
+    st.success("Strong Uptrend: Price is above both moving averages, and 100-day MA is above 200-day MA")
+elif trend == 'potential_uptrend':
+    st.info("Potential Uptrend: 100-day MA is above 200-day MA, but price is below 100-day MA")
+elif trend == 'strong_downtrend':
+    st.error("Strong Downtrend: Price is below both moving averages, and 100-day MA is below 200-day MA")
 else:
-    if current_price < current_ma100:
-        st.error("Strong Downtrend: Price is below both moving averages, and 100-day MA is below 200-day MA")
-    else:
-        st.warning("Potential Downtrend: 100-day MA is below 200-day MA, but price is above 100-day MA")
+    st.warning("Potential Downtrend: 100-day MA is below 200-day MA, but price is above 100-day MA")
 
-# Split data into train/test
-train_data = df['Close'][:int(len(df)*0.7)]
-test_data = df['Close'][int(len(df)*0.7):]
-
-# Normalize the data
-scaler = MinMaxScaler(feature_range=(0,1))
-train_array = scaler.fit_transform(np.array(train_data).reshape(-1, 1))
-
-# Load model
-try:
-    model = load_model('keras_model.keras')
-except Exception as e:
-    st.error(f"Error loading model: {e}")
-    st.stop()
-
-# Prepare test data for prediction
-past_100_days = train_data.tail(100)
-final_df = pd.concat([past_100_days, test_data], ignore_index=True)
-input_data = scaler.transform(np.array(final_df).reshape(-1, 1))
-
-x_test = []
-y_test = []
-for i in range(100, input_data.shape[0]):
-    x_test.append(input_data[i-100:i])
-    y_test.append(input_data[i, 0])
-
-x_test, y_test = np.array(x_test), np.array(y_test)
-y_predicted = model.predict(x_test)
+def predict_prices():
+    # Load model
+    try:
+        # NumPy backend by default; set PREDICTOR_BACKEND=keras for the TensorFlow path
+        with timer.span('load_model'):
+            model = get_model(bundle.model_path)
+    except Exception as e:
+        st.error(f"Error loading model: {e}")
+        st.stop()
+    return predict_test_span(model, bundle, ticker, df['Close'], data_key, span=timer.span)
 
-# Reverse scaling
-y_predicted = y_predicted * (1 / scaler.scale_[0])
-y_test = y_test * (1 / scaler.scale_[0])
+_, y_test, y_predicted, model_key = session.memo(('predict', bundle.version, QUANTIZATION),
+                                                 predict_prices)
 
 # Plot prediction vs original
 st.subheader('🔮 Predicted vs Actual Closing Price')
-fig2 = plt.figure(figsize=(12,6))
-plt.plot(y_test, 'g', label='Actual Price')
-plt.plot(y_predicted, 'r', label='Predicted Price')
-plt.xlabel('Time')
-plt.ylabel('Stock Price')
-plt.legend()
-st.pyplot(fig2)
+show_chart('prediction', lambda: charts.prediction_chart(y_test, y_predicted), model_key)
 
 
 
@@ -369,11 +355,10 @@ print(df['Volume'].shape)
 
 # Volume Chart
 st.subheader('Trading Volume History')
-fig3 = plt.figure(figsize=(12,6))
-plt.plot(df.index, df['Volume'], color='purple', alpha=0.6)
-plt.fill_between(df.index, df['Volume'], color='purple', alpha=0.2)
-plt.grid(True, alpha=0.3)
-plt.xlabel('Date')
-plt.ylabel('Volume')
-st.pyplot(fig3)
-plt.close()
\ No newline at end of file
+show_chart('volume', lambda: charts.volume_chart(df['Volume']))
+
+# Where this run's time went; stages served from session state or the
+# caches show up as near-zero spans
+with st.expander("⏱️ Performance", expanded=False):
+    st.dataframe(pd.DataFrame(timer.rows()), use_container_width=True)
+    st.caption(f"Run {timer.run_id}: {timer.total * 1e3:.0f} ms across timed stages")
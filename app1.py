@@ -1,4 +1,3 @@
-import numpy as np
 import pandas as pd
 import yfinance as yf
 from keras.models import load_model
@@ -7,6 +6,8 @@ import matplotlib.pyplot as plt
 import datetime
 from sklearn.preprocessing import MinMaxScaler
 
+from predictor.windows import make_windows
+
 # ------------------ Streamlit App: Stock Price Predictor ------------------ #
 
 
@@ -186,13 +187,7 @@ past_100_days = train_data.tail(100)
 final_df = pd.concat([past_100_days, test_data], ignore_index=True)
 input_data = scaler.transform(final_df)
 
-x_test = []
-y_test = []
-for i in range(100, input_data.shape[0]):
-    x_test.append(input_data[i-100:i])
-    y_test.append(input_data[i, 0])
-
-x_test, y_test = np.array(x_test), np.array(y_test)
+x_test, y_test = make_windows(input_data, window=100)
 y_predicted = model.predict(x_test)
 
 # Reverse scaling
@@ -0,0 +1,72 @@
+"""Benchmark: concurrent small predict calls, direct vs micro-batched.
+
+    python benchmarks/bench_batching.py [--callers 1 8 32] [--windows 1] [--wait-ms 2 5]
+
+Each caller thread stands in for a session or API request predicting
+``--windows`` new windows at a time (one per new bar, as the incremental
+prediction store does) and repeats for ``--seconds``. Compares calling the
+shared model directly against routing through ``MicroBatcher`` with each
+``--wait-ms``. Uses ``random_lstm()``, so it runs offline.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.config import WINDOW  # noqa: E402
+from predictor.registry import SharedModel  # noqa: E402
+from predictor.synthetic import random_lstm  # noqa: E402
+
+
+def drive(model, callers, windows, seconds):
+    x = np.random.default_rng(0).random((windows, WINDOW, 1), dtype=np.float32)
+    latencies = [[] for _ in range(callers)]
+    deadline = time.monotonic() + seconds
+
+    def caller(out):
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            model.predict(x)
+            out.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=caller, args=(out,)) for out in latencies]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    done = np.concatenate([np.asarray(out) for out in latencies])
+    return len(done) * windows / wall, np.percentile(done, 50) * 1e3, np.percentile(done, 99) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--callers', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--windows', type=int, default=1, help='windows per call')
+    parser.add_argument('--wait-ms', type=float, nargs='+', default=[2, 5])
+    parser.add_argument('--max-batch', type=int, default=1024)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    model = random_lstm()
+    print(f"{'callers':>8} {'mode':>14} {'windows/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'win/pass':>9}")
+    for callers in args.callers:
+        modes = [('direct', SharedModel(model, 'numpy', batch_size=0))]
+        for wait in args.wait_ms:
+            shared = SharedModel(model, 'numpy', batch_size=args.max_batch)
+            shared.batcher.max_wait = wait / 1e3
+            modes.append((f'batched {wait:g}ms', shared))
+        for name, shared in modes:
+            throughput, p50, p99 = drive(shared, callers, args.windows, args.seconds)
+            per_pass = shared.batcher.stats()['windows_per_pass'] if shared.batcher else args.windows
+            print(f"{callers:>8} {name:>14} {throughput:>10.0f} {p50:>8.1f} {p99:>8.1f} {per_pass:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
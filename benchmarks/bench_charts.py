@@ -0,0 +1,62 @@
+"""Benchmark: chart render time with and without LTTB downsampling.
+
+    python benchmarks/bench_charts.py [--bars 6000 50000 500000]
+
+Renders the closing-price, combined moving-average and volume charts to
+PNG the way the app does, once plotting every bar and once reduced to
+``charts.MAX_POINTS``. Times include the downsampling itself.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor import charts  # noqa: E402
+from predictor.pipeline import moving_averages  # noqa: E402
+from predictor.render_cache import figure_bytes  # noqa: E402
+from predictor.synthetic import gbm_ohlcv  # noqa: E402
+
+
+def chart_builders(df, max_points):
+    close = df['Close']
+    ma100, ma200 = moving_averages(close)
+    return {
+        'close': lambda: charts.line_chart('Closing Price', close, max_points=max_points),
+        'ma_combined': lambda: charts.moving_average_chart(
+            close, 'Combined', [(ma100, '100-Day MA', 'red'), (ma200, '200-Day MA', 'blue')],
+            max_points=max_points),
+        'volume': lambda: charts.volume_chart(df['Volume'], max_points=max_points),
+    }
+
+
+def render_time(draw, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        figure_bytes(draw())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=int, nargs='+', default=[6_000, 50_000, 500_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'bars':>8} {'chart':>12} {'full':>10} {'lttb':>10} {'speedup':>8}")
+    for bars in args.bars:
+        df = gbm_ohlcv(bars)
+        full = chart_builders(df, None)
+        reduced = chart_builders(df, charts.MAX_POINTS)
+        for name in full:
+            before = render_time(full[name], args.repeat)
+            after = render_time(reduced[name], args.repeat)
+            print(f"{bars:>8} {name:>12} {before * 1e3:>8.0f}ms {after * 1e3:>8.0f}ms "
+                  f"{before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
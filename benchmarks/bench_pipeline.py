@@ -0,0 +1,176 @@
+"""Benchmark the prediction pipeline stage by stage on synthetic data.
+
+    python benchmarks/bench_pipeline.py [--bars 1000 10000 100000 1000000]
+    python benchmarks/bench_pipeline.py --model keras_model.keras --backend numpy
+
+Generates GBM OHLCV series (predictor.synthetic) and times, in isolation
+and then end to end, each stage app.py runs after the fetch: MA100/MA200,
+scaler fit + transform, windowing, ``model.predict`` and rendering the
+six charts. By default the model is ``random_lstm()`` (the notebook's
+architecture with random weights), so nothing is read from disk or the
+network. ``model.predict`` runs on at most ``--predict-cap`` windows (the
+newest ones); the predict row reports the count and windows/s.
+
+Every run appends a record to ``--history`` (a JSON list, by default
+under ``PREDICTOR_CACHE_DIR`` so it stays out of the tree) so later runs can
+be compared with earlier ones.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from predictor import charts  # noqa: E402
+from predictor.config import CACHE_DIR, WINDOW  # noqa: E402
+from predictor.pipeline import fit_scaler, moving_averages, split_train_test  # noqa: E402
+from predictor.render_cache import figure_bytes  # noqa: E402
+from predictor.synthetic import gbm_ohlcv, random_lstm  # noqa: E402
+from predictor.windows import make_windows  # noqa: E402
+
+HISTORY = os.path.join(CACHE_DIR, 'benchmarks', 'history.json')
+
+# Longest series that still fits in business-day dates; beyond it bars are minutes
+MAX_DAILY_BARS = 100_000
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # Long GBM runs drift far outside the training range, so the random
+        # model's gates saturate; the values don't matter here, only the time
+        with np.errstate(over='ignore'):
+            result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def scale(close):
+    train, test = split_train_test(close)
+    scaler = fit_scaler(train)
+    final = pd.concat([train.tail(WINDOW), test])
+    return scaler, scaler.transform(np.asarray(final).reshape(-1, 1))
+
+
+def render_charts(df, ma100, ma200, y_test, y_predicted):
+    close = df['Close']
+    figures = [
+        charts.line_chart('Closing Price', close),
+        charts.moving_average_chart(close, '100-Day', [(ma100, '100-Day MA', 'red')]),
+        charts.moving_average_chart(close, '200-Day', [(ma200, '200-Day MA', 'blue')]),
+        charts.moving_average_chart(close, 'Combined', [(ma100, '100-Day MA', 'red'),
+                                                        (ma200, '200-Day MA', 'blue')]),
+        charts.prediction_chart(y_test, y_predicted),
+        charts.volume_chart(df['Volume']),
+    ]
+    return sum(len(figure_bytes(fig)) for fig in figures)
+
+
+def end_to_end(df, model, cap):
+    ma100, ma200 = moving_averages(df['Close'])
+    scaler, scaled = scale(df['Close'])
+    x, y = make_windows(scaled)
+    x, y = x[-cap:], y[-cap:]
+    y_predicted = scaler.inverse_transform(model.predict(x))
+    return render_charts(df, ma100, ma200, scaler.inverse_transform(y), y_predicted)
+
+
+def bench_size(bars, model, args):
+    df = gbm_ohlcv(bars, seed=args.seed, freq='B' if bars <= MAX_DAILY_BARS else 'min')
+    close = df['Close']
+    stages = {}
+
+    stages['moving_averages'], (ma100, ma200) = best_of(lambda: moving_averages(close), args.repeat)
+    stages['scaling'], (scaler, scaled) = best_of(lambda: scale(close), args.repeat)
+    stages['windowing'], (x, y) = best_of(lambda: make_windows(scaled), args.repeat)
+    x, y = x[-args.predict_cap:], y[-args.predict_cap:]
+    stages['predict'], raw = best_of(lambda: model.predict(x), args.repeat)
+    y_test, y_predicted = scaler.inverse_transform(y), scaler.inverse_transform(raw)
+    stages['charts'], _ = best_of(lambda: render_charts(df, ma100, ma200, y_test, y_predicted),
+                                  args.repeat)
+    stages['end_to_end'], _ = best_of(lambda: end_to_end(df, model, args.predict_cap), args.repeat)
+
+    return {'bars': bars, 'predict_windows': len(x),
+            'windows_per_second': round(len(x) / stages['predict'], 1),
+            'seconds': {name: round(seconds, 6) for name, seconds in stages.items()}}
+
+
+def load_model(args):
+    if not args.model:
+        return random_lstm(seed=args.seed), 'random_lstm'
+    from predictor.inference import load_model as load
+    return load(args.model, backend=args.backend), f'{args.model} ({args.backend})'
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(path, record):
+    history = []
+    if os.path.exists(path):
+        with open(path) as fh:
+            history = json.load(fh)
+    history.append(record)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as fh:
+        json.dump(history, fh, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--predict-cap', type=int, default=2_000)
+    parser.add_argument('--model', help='.keras file to benchmark instead of a random-weight model')
+    parser.add_argument('--backend', default='numpy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--history', default=HISTORY)
+    parser.add_argument('--no-history', action='store_true')
+    args = parser.parse_args()
+
+    model, model_name = load_model(args)
+    model.predict(np.zeros((1, WINDOW, 1), dtype=np.float32))
+
+    stage_names = ('moving_averages', 'scaling', 'windowing', 'predict', 'charts', 'end_to_end')
+    print(f"{'bars':>9} " + ' '.join(f'{name:>15}' for name in stage_names) + f" {'windows/s':>10}")
+    results = []
+    for bars in args.bars:
+        result = bench_size(bars, model, args)
+        results.append(result)
+        print(f"{bars:>9} " + ' '.join(f"{result['seconds'][name] * 1e3:>13.1f}ms"
+                                       for name in stage_names)
+              + f" {result['windows_per_second']:>10.0f}")
+
+    if not args.no_history:
+        append_history(args.history, {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'model': model_name,
+            'repeat': args.repeat,
+            'predict_cap': args.predict_cap,
+            'results': results,
+        })
+        print(f"appended to {args.history}")
+
+
+if __name__ == '__main__':
+    main()
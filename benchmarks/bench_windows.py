@@ -0,0 +1,44 @@
+"""Micro-benchmark: Python-loop windowing vs ``make_windows``.
+
+    python benchmarks/bench_windows.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.windows import make_windows  # noqa: E402
+
+WINDOW = 100
+
+
+def loop_windows(input_data):
+    # The loop app.py used before make_windows
+    x_test = []
+    y_test = []
+    for i in range(WINDOW, input_data.shape[0]):
+        x_test.append(input_data[i - WINDOW:i])
+        y_test.append(input_data[i, 0])
+    return np.array(x_test), np.array(y_test)
+
+
+def best_of(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'bars':>8} {'loop':>10} {'view':>10} {'float32':>10} {'speedup':>9}")
+    for bars in (5_000, 50_000, 500_000):
+        data = rng.random((bars, 1))
+        loop = best_of(lambda: loop_windows(data), repeat=1 if bars > 50_000 else 3)
+        view = best_of(lambda: make_windows(data))
+        f32 = best_of(lambda: make_windows(data, dtype=np.float32))
+        print(f"{bars:>8} {loop * 1e3:>8.1f}ms {view * 1e3:>8.3f}ms {f32 * 1e3:>8.1f}ms {loop / view:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: predict and chart rendering side by side, in-process vs worker pool.
+
+    python benchmarks/bench_worker_pool.py [--pool-size 1 2] [--windows 900] [--backend numpy]
+
+One thread repeatedly predicts ``--windows`` windows with the bundled
+model while another renders the closing-price chart, as two sessions of
+the app would. Reports predictions/s and chart renders/s, first with the
+model loaded in this process and then through an ``InferencePool`` of each
+``--pool-size``. Fewer cores than workers means no extra throughput, only
+that rendering no longer waits on the GIL behind the forward pass.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor import charts  # noqa: E402
+from predictor.config import INFERENCE_BACKEND, WINDOW  # noqa: E402
+from predictor.inference import load_model  # noqa: E402
+from predictor.registry import get_bundle  # noqa: E402
+from predictor.render_cache import figure_bytes  # noqa: E402
+from predictor.synthetic import gbm_ohlcv  # noqa: E402
+from predictor.worker_pool import InferencePool  # noqa: E402
+
+
+def drive(model, close, windows, seconds):
+    x = np.random.default_rng(0).random((windows, WINDOW, 1), dtype=np.float32)
+    counts = {'predict': 0, 'render': 0}
+    deadline = time.monotonic() + seconds
+
+    def predictor():
+        while time.monotonic() < deadline:
+            model.predict(x, verbose=0)
+            counts['predict'] += 1
+
+    def renderer():
+        while time.monotonic() < deadline:
+            figure_bytes(charts.line_chart('Closing Price', close))
+            counts['render'] += 1
+
+    threads = [threading.Thread(target=predictor), threading.Thread(target=renderer)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    return counts['predict'] / wall, counts['render'] / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pool-size', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--windows', type=int, default=900, help='windows per predict call')
+    parser.add_argument('--bars', type=int, default=5000)
+    parser.add_argument('--backend', default=INFERENCE_BACKEND)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    path = get_bundle().model_path
+    close = gbm_ohlcv(args.bars)['Close']
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'mode':>10} {'predicts/s':>11} {'renders/s':>10}")
+    model = load_model(path, backend=args.backend)
+    model.predict(np.zeros((1, WINDOW, 1), dtype=np.float32), verbose=0)
+    predicts, renders = drive(model, close, args.windows, args.seconds)
+    print(f"{'in-process':>10} {predicts:>11.2f} {renders:>10.2f}")
+    for size in args.pool_size:
+        pool = InferencePool(path, backend=args.backend, size=size).start()
+        try:
+            predicts, renders = drive(pool, close, args.windows, args.seconds)
+        finally:
+            pool.close()
+        print(f"{'pool ' + str(size):>10} {predicts:>11.2f} {renders:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Shared helpers for the Stock Price Predictor apps."""
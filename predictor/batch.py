@@ -0,0 +1,62 @@
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .config import WINDOW
+from .pipeline import prepare_test_windows
+
+TickerPrediction = namedtuple('TickerPrediction', ['y_predicted', 'y_test', 'end_dates', 'scaler'])
+
+
+class BatchStats:
+    def __init__(self, tickers, windows, predict_calls, seconds):
+        self.tickers = tickers
+        self.windows = windows
+        self.predict_calls = predict_calls
+        self.seconds = seconds
+
+    @property
+    def windows_per_second(self):
+        return self.windows / self.seconds if self.seconds else float('inf')
+
+    def __repr__(self):
+        return (f"BatchStats({self.tickers} tickers, {self.windows} windows, "
+                f"{self.predict_calls} predict calls, {self.windows_per_second:,.0f} windows/s)")
+
+
+def predict_many(closes, model, scalers=None, window=WINDOW, batch_size=None):
+    """Predict the test span of many tickers with one ``predict`` per model.
+
+    ``closes`` maps ticker -> close price Series. ``model`` is either one
+    model shared by every ticker or a dict ticker -> model; tickers on the
+    same model are concatenated into a single batch and the outputs split
+    back. Each ticker keeps its own scaler: taken from ``scalers`` when
+    given, otherwise fitted on its training span as in app.py.
+
+    Returns ``({ticker: TickerPrediction}, BatchStats)``; predictions are in
+    scaled units, like ``model.predict``.
+    """
+    scalers = scalers or {}
+    prepared = {ticker: prepare_test_windows(close, scaler=scalers.get(ticker), window=window)
+                for ticker, close in closes.items()}
+
+    # Group tickers by the model object that serves them
+    groups = {}
+    for ticker in prepared:
+        ticker_model = model[ticker] if isinstance(model, dict) else model
+        groups.setdefault(id(ticker_model), (ticker_model, []))[1].append(ticker)
+
+    results = {}
+    start = time.perf_counter()
+    for group_model, tickers in groups.values():
+        x = np.concatenate([prepared[t].x for t in tickers])
+        y_predicted = np.asarray(group_model.predict(x, batch_size=batch_size, verbose=0))
+        offsets = np.cumsum([len(prepared[t].x) for t in tickers])[:-1]
+        for ticker, part in zip(tickers, np.split(y_predicted, offsets)):
+            p = prepared[ticker]
+            results[ticker] = TickerPrediction(part, p.y, p.end_dates, p.scaler)
+    seconds = time.perf_counter() - start
+
+    windows = sum(len(p.x) for p in prepared.values())
+    return results, BatchStats(len(prepared), windows, len(groups), seconds)
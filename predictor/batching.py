@@ -0,0 +1,133 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from .config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS
+
+
+class MicroBatcher:
+    """Fuse concurrent ``predict`` calls into one forward pass.
+
+    Callers on any thread hand in window batches and block (or await) on a
+    future. A dispatcher thread takes the first pending request, keeps
+    collecting for up to ``max_wait`` seconds or until ``max_batch`` windows
+    are waiting, runs ``predict_fn`` once on the concatenation and scatters
+    the rows back. A request of ``max_batch`` windows or more goes through
+    on its own without waiting. ``predict_fn`` may also return a future
+    (``InferencePool.submit``), letting up to ``max_in_flight`` fused passes
+    run at once; while all of them are busy, new requests keep queueing and
+    go out together in the next pass.
+    """
+
+    def __init__(self, predict_fn, max_batch=BATCH_MAX_SIZE, max_wait=BATCH_MAX_WAIT_MS / 1e3,
+                 max_in_flight=1):
+        self.predict_fn = predict_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._slots = threading.Semaphore(max_in_flight)
+        self.requests = 0
+        self.windows = 0
+        self.passes = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, x):
+        """Queue ``x``; returns a ``concurrent.futures.Future`` of its predictions."""
+        self._ensure_started()
+        future = Future()
+        self._queue.put((np.asarray(x, dtype=np.float32), future))
+        return future
+
+    def predict(self, x, **kwargs):
+        """Blocking ``model.predict`` contract; extra Keras kwargs are ignored."""
+        return self.submit(x).result()
+
+    async def predict_async(self, x):
+        return await asyncio.wrap_future(self.submit(x))
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+                self._thread.start()
+
+    def _collect(self):
+        pending = [self._queue.get()]
+        size = len(pending[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.append(item)
+            size += len(item[0])
+        return pending
+
+    def _run(self):
+        while True:
+            # Take a pass slot before collecting, so requests arriving while
+            # every pass is busy fuse into the next one
+            self._slots.acquire()
+            pending = self._collect()
+            # Windows of different lengths (another bundle's window) can't share a pass
+            groups = {}
+            for x, future in pending:
+                if future.set_running_or_notify_cancel():
+                    groups.setdefault(x.shape[1:], []).append((x, future))
+            if not groups:
+                self._slots.release()
+            for i, group in enumerate(groups.values()):
+                if i:
+                    self._slots.acquire()
+                self._run_group(group)
+
+    def _run_group(self, group):
+        # Releases the group's pass slot once the pass has finished
+        try:
+            x = np.concatenate([x for x, _ in group]) if len(group) > 1 else group[0][0]
+            result = self.predict_fn(x)
+        except BaseException as e:
+            self._slots.release()
+            self._fail(group, e)
+            return
+        self.requests += len(group)
+        self.windows += len(x)
+        self.passes += 1
+        if isinstance(result, Future):
+            # predict_fn handed the pass to another process (InferencePool.submit);
+            # scatter when it lands so the dispatcher can collect the next batch
+            result.add_done_callback(lambda done: self._settle(group, done))
+        else:
+            self._slots.release()
+            self._scatter(group, result)
+
+    def _settle(self, group, done):
+        self._slots.release()
+        try:
+            y = done.result()
+        except BaseException as e:
+            self._fail(group, e)
+            return
+        self._scatter(group, y)
+
+    def _scatter(self, group, y):
+        offsets = np.cumsum([len(x) for x, _ in group])[:-1]
+        for (_, future), part in zip(group, np.split(np.asarray(y), offsets)):
+            future.set_result(part)
+
+    def _fail(self, group, error):
+        for _, future in group:
+            future.set_exception(error)
+
+    def stats(self):
+        return {'requests': self.requests, 'windows': self.windows, 'passes': self.passes,
+                'windows_per_pass': self.windows / self.passes if self.passes else 0.0}
@@ -0,0 +1,110 @@
+import datetime
+import hashlib
+import json
+import os
+import zipfile
+
+from .config import CACHE_DIR, WINDOW
+from .ohlcv_cache import ticker_key, write_atomic
+from .pipeline import TRAIN_FRACTION, fit_scaler, split_train_test
+from .prediction_store import model_version
+from .scaling import MinMaxParams
+
+FORMAT_VERSION = 1
+
+# Archive layout: the Keras model as saved by the notebook, plus everything
+# serving needs to feed it
+MODEL_MEMBER = 'model.keras'
+META_MEMBER = 'bundle.json'
+
+
+class ModelBundle:
+    """A trained model together with its scaler, window length and provenance.
+
+    ``scaler`` is the one fitted on the training closes; ``None`` for a bare
+    ``.keras`` file wrapped with ``from_model``.
+    """
+
+    def __init__(self, model_path, version, window=WINDOW, scaler=None, metadata=None):
+        self.model_path = model_path
+        self.version = version
+        self.window = window
+        self.scaler = scaler
+        self.metadata = metadata or {}
+
+    @property
+    def ticker(self):
+        return self.metadata.get('ticker')
+
+    @classmethod
+    def load(cls, path, extract_dir=None):
+        """Open a bundle archive; the model is unpacked once per bundle version."""
+        with zipfile.ZipFile(path) as archive:
+            meta = json.loads(archive.read(META_MEMBER))
+            if meta['format_version'] > FORMAT_VERSION:
+                raise ValueError(f"{path} uses bundle format {meta['format_version']}, "
+                                 f"this build reads up to {FORMAT_VERSION}")
+            target = os.path.join(extract_dir or os.path.join(CACHE_DIR, 'bundles'), meta['version'])
+            model_path = os.path.join(target, MODEL_MEMBER)
+            if not os.path.exists(model_path):
+                os.makedirs(target, exist_ok=True)
+                data = archive.read(MODEL_MEMBER)
+
+                def write(tmp):
+                    with open(tmp, 'wb') as fh:
+                        fh.write(data)
+
+                write_atomic(model_path, write)
+        scaler = MinMaxParams.from_dict(meta['scaler']) if meta.get('scaler') else None
+        return cls(model_path, meta['version'], meta['window'], scaler, meta.get('training'))
+
+    @classmethod
+    def from_model(cls, model_path, window=WINDOW):
+        """Treat a plain ``.keras`` file as a bundle with no stored scaler."""
+        return cls(model_path, model_version(model_path), window)
+
+    def scaler_for(self, ticker, close):
+        """Scaler to serve ``ticker`` with.
+
+        The training ticker uses the stored scaler as-is. Any other ticker
+        sits on a different price range, so it gets min/max over its own
+        training span (two NumPy reductions, no sklearn).
+        """
+        if self.scaler is not None and self.ticker and ticker_key(ticker) == ticker_key(self.ticker):
+            return self.scaler
+        return fit_scaler(split_train_test(close)[0])
+
+
+def build_bundle(model_path, close, out_path, ticker=None, window=WINDOW, notes=None):
+    """Write a bundle for ``model_path`` trained on the ``close`` Series.
+
+    The scaler is fitted on the first ``TRAIN_FRACTION`` of ``close``, the
+    same split the notebook trains on.
+    """
+    train, _ = split_train_test(close)
+    scaler = fit_scaler(train)
+    with open(model_path, 'rb') as fh:
+        model_bytes = fh.read()
+    digest = hashlib.sha1(model_bytes)
+    digest.update(json.dumps(scaler.to_dict(), sort_keys=True).encode())
+    digest.update(str(window).encode())
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'version': digest.hexdigest()[:12],
+        'window': window,
+        'scaler': scaler.to_dict(),
+        'training': {
+            'ticker': ticker,
+            'train_fraction': TRAIN_FRACTION,
+            'start': str(close.index[0].date()) if len(close) else None,
+            'end': str(train.index[-1].date()) if len(train) else None,
+            'rows': len(train),
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'notes': notes,
+        },
+    }
+    with zipfile.ZipFile(out_path, 'w', compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr(META_MEMBER, json.dumps(meta, indent=2))
+        archive.writestr(MODEL_MEMBER, model_bytes)
+    return meta
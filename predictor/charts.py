@@ -0,0 +1,65 @@
+from matplotlib.figure import Figure
+
+from .downsample import downsample
+from .render_cache import DPI
+
+FIGSIZE = (12, 6)
+
+# Long series are reduced to about one point per horizontal pixel of the
+# rendered figure before plotting; pass max_points=None to plot every bar
+MAX_POINTS = int(FIGSIZE[0] * DPI)
+
+# Figures are built as standalone Figure objects rather than through pyplot:
+# nothing registers them in pyplot's global figure manager, so a figure is
+# gone as soon as the caller drops it (render_cache.figure_bytes also clears
+# it after rasterizing). pyplot figures live until plt.close().
+
+
+def line_chart(title, *series, max_points=MAX_POINTS):
+    fig = Figure(figsize=FIGSIZE)
+    ax = fig.subplots()
+    for data in series:
+        ax.plot(downsample(data, max_points))
+    ax.set_title(title)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Price')
+    return fig
+
+
+def moving_average_chart(close, title, averages, close_alpha=0.8, max_points=MAX_POINTS):
+    """Closing price with one or more ``(series, label, color)`` moving averages."""
+    fig = Figure(figsize=FIGSIZE)
+    ax = fig.subplots()
+    ax.plot(downsample(close, max_points), label='Closing Price', alpha=close_alpha)
+    for ma, label, color in averages:
+        ax.plot(downsample(ma, max_points), label=label, color=color, linewidth=2)
+    ax.set_title(title)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Price ($)')
+    ax.set_ylim(0, 1550)  # Set y-axis range
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def prediction_chart(y_test, y_predicted):
+    fig = Figure(figsize=FIGSIZE)
+    ax = fig.subplots()
+    ax.plot(y_test, 'g', label='Actual Price')
+    ax.plot(y_predicted, 'r', label='Predicted Price')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Stock Price')
+    ax.legend()
+    return fig
+
+
+def volume_chart(volume, max_points=MAX_POINTS):
+    volume = downsample(volume, max_points)
+    fig = Figure(figsize=FIGSIZE)
+    ax = fig.subplots()
+    ax.plot(volume.index, volume, color='purple', alpha=0.6)
+    ax.fill_between(volume.index, volume, color='purple', alpha=0.2)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Volume')
+    return fig
@@ -0,0 +1,70 @@
+import os
+
+# ------------------ Paths ------------------ #
+
+# Where fetched price history and other derived artifacts are kept between runs
+CACHE_DIR = os.environ.get("PREDICTOR_CACHE_DIR", ".cache")
+
+# ------------------ Charts ------------------ #
+
+# Upper bound on rendered chart bytes kept in memory by the render cache
+RENDER_CACHE_BYTES = int(float(os.environ.get("PREDICTOR_RENDER_CACHE_MB", "64")) * 1024 * 1024)
+
+# "matplotlib" rasterizes charts on the server; "plotly" sends downsampled
+# WebGL (Scattergl) traces that the browser draws, zooms and pans
+CHART_BACKEND = os.environ.get("PREDICTOR_CHARTS", "matplotlib")
+
+# ------------------ Alpha Vantage ------------------ #
+
+# Calls per minute allowed by our plan; the fetch scheduler stays under it
+ALPHA_VANTAGE_CALLS_PER_MINUTE = float(os.environ.get("ALPHA_VANTAGE_CALLS_PER_MINUTE", "5"))
+
+# Both Procfile processes read these, and each runs its own scheduler, so the
+# plan is split: the HTTP API (api.py) gets API_CALLS_PER_MINUTE and the app
+# the rest. 0 (no api process) leaves the app the whole plan; api.py needs a share
+API_CALLS_PER_MINUTE = float(os.environ.get("ALPHA_VANTAGE_API_CALLS_PER_MINUTE", "0"))
+WEB_CALLS_PER_MINUTE = ALPHA_VANTAGE_CALLS_PER_MINUTE - API_CALLS_PER_MINUTE
+
+# Point the fetch layer at another server speaking the Alpha Vantage API, e.g.
+# tools/av_stub.py at http://127.0.0.1:8765; empty means the real service
+ALPHA_VANTAGE_BASE_URL = os.environ.get("ALPHA_VANTAGE_BASE_URL", "")
+
+# ------------------ Model ------------------ #
+
+# Number of past closes the LSTM sees per prediction
+WINDOW = 100
+
+MODEL_PATH = os.environ.get("PREDICTOR_MODEL_PATH", "keras_model.keras")
+
+# Model + fitted scaler + training metadata (tools/build_bundle.py); when it is
+# missing the app serves MODEL_PATH and scales each ticker on its own history
+BUNDLE_PATH = os.environ.get("PREDICTOR_BUNDLE_PATH", "model_bundle.zip")
+
+# "numpy" serves predictions without importing TensorFlow; "keras" is the reference
+# path; "tflite"/"onnx" run the exports from tools/export_model.py
+INFERENCE_BACKEND = os.environ.get("PREDICTOR_BACKEND", "numpy")
+
+# Post-training weight quantization to serve: "", "int8" or "float16"
+# (numpy and tflite backends; see tools/quantization_report.py)
+QUANTIZATION = os.environ.get("PREDICTOR_QUANTIZATION", "")
+
+# Threads for the tflite/onnx interpreters; 0 lets the runtime decide
+INFERENCE_THREADS = int(os.environ.get("PREDICTOR_INFERENCE_THREADS", "0")) or None
+
+# Concurrent predict calls are fused into one forward pass: the first caller
+# waits up to BATCH_MAX_WAIT_MS for others, up to BATCH_MAX_SIZE windows in
+# total. BATCH_MAX_SIZE=0 calls the model directly from each caller
+BATCH_MAX_WAIT_MS = float(os.environ.get("PREDICTOR_BATCH_MAX_WAIT_MS", "2"))
+BATCH_MAX_SIZE = int(os.environ.get("PREDICTOR_BATCH_MAX_SIZE", "1024"))
+
+# Worker processes that run inference outside the web tier (0 = in-process).
+# Each caps TensorFlow/BLAS to TF_INTRA_OP_THREADS threads (0 = cores / pool
+# size) and TF_INTER_OP_THREADS concurrent ops so workers don't oversubscribe
+POOL_SIZE = int(os.environ.get("PREDICTOR_POOL_SIZE", "0"))
+TF_INTRA_OP_THREADS = int(os.environ.get("PREDICTOR_TF_INTRA_OP_THREADS", "0"))
+TF_INTER_OP_THREADS = int(os.environ.get("PREDICTOR_TF_INTER_OP_THREADS", "1"))
+
+# ------------------ Diagnostics ------------------ #
+
+# Stage timings are logged as JSON lines; to stderr unless this names a file
+TIMING_LOG = os.environ.get("PREDICTOR_TIMING_LOG", "")
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, n_out):
+    """Indices of ``n_out`` points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` equal buckets, and from each bucket the point
+    kept is the one forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Spikes survive; flat stretches
+    collapse. Bucket means and the candidate points come from array ops;
+    only the walk over buckets is a Python loop, because each pick depends
+    on the one before it.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # Work relative to the first x so datetime nanoseconds keep their precision
+    x = x - x[0]
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    mean_x = (sum_x[ends] - sum_x[starts]) / counts
+    mean_y = (sum_y[ends] - sum_y[starts]) / counts
+    # The third corner: next bucket's mean, or the last point for the final bucket
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    # Buckets differ by at most one point; pad short ones with their last point
+    candidates = starts[:, None] + np.arange(counts.max())
+    candidates = np.minimum(candidates, ends[:, None] - 1)
+    px, py = x[candidates], y[candidates]
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for b in range(len(starts)):
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[b]) * (py[b] - ay) - (ax - px[b]) * (next_y[b] - ay))
+        a = candidates[b, area.argmax()]
+        picked[b + 1] = a
+    return picked
+
+
+def downsample(series, max_points):
+    """``series`` reduced to at most ``max_points`` points with LTTB.
+
+    Works on a pandas Series (a datetime index is used as x) or a 1-D array
+    (position is x). Missing values, e.g. the warm-up of a moving average,
+    are dropped first; ``max_points=None`` returns the series unchanged.
+    """
+    if max_points is None or len(series) <= max_points:
+        return series
+    if isinstance(series, pd.Series):
+        series = series.dropna()
+        index = series.index
+        x = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.arange(len(series))
+        return series.iloc[lttb(x, series.to_numpy(), max_points)]
+    values = np.asarray(series).reshape(-1)
+    values = values[~np.isnan(values)]
+    return values[lttb(np.arange(len(values)), values, max_points)]
@@ -0,0 +1,270 @@
+import asyncio
+import itertools
+import threading
+import time
+
+import aiohttp
+from alpha_vantage.async_support.timeseries import TimeSeries
+
+from .config import ALPHA_VANTAGE_BASE_URL, ALPHA_VANTAGE_CALLS_PER_MINUTE, WEB_CALLS_PER_MINUTE
+
+COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Lower runs first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_THROTTLE_MARKERS = ('call frequency', 'rate limit', 'requests per day')
+
+
+class ThrottledError(Exception):
+    """Alpha Vantage answered with a rate-limit note instead of data."""
+
+
+class UnknownSymbolError(ValueError):
+    """Alpha Vantage answered "Invalid API call", which is how it rejects unknown symbols."""
+
+
+def _is_throttle(error):
+    text = str(error).lower()
+    return any(marker in text for marker in _THROTTLE_MARKERS)
+
+
+def _is_unknown_symbol(error):
+    # Bad keys and other refusals carry different messages; those stay ValueErrors
+    return str(error).lower().startswith('invalid api call')
+
+
+class RoutedTimeSeries(TimeSeries):
+    """``TimeSeries`` whose requests go to ``base_url`` instead of alphavantage.co.
+
+    The library builds every URL on its fixed ``_ALPHA_VANTAGE_API_URL``
+    prefix; this swaps the prefix for ``<base_url>/query?`` just before the
+    request is made, leaving the query string untouched.
+    """
+
+    def __init__(self, *args, base_url, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url.rstrip('/') + '/query?'
+
+    async def _handle_api_call(self, url):
+        if url.startswith(self._ALPHA_VANTAGE_API_URL):
+            url = self.base_url + url[len(self._ALPHA_VANTAGE_API_URL):]
+        return await super()._handle_api_call(url)
+
+
+def make_client(api_key, base_url=ALPHA_VANTAGE_BASE_URL):
+    """A pandas-output ``TimeSeries`` for the real service or ``base_url``."""
+    if base_url:
+        return RoutedTimeSeries(key=api_key, output_format='pandas', base_url=base_url)
+    return TimeSeries(key=api_key, output_format='pandas')
+
+
+async def fetch_daily(symbol, api_key, outputsize='compact', client=None):
+    """Fetch daily bars for ``symbol`` from Alpha Vantage, oldest first.
+
+    ``outputsize='compact'`` returns the latest 100 bars, ``'full'`` the
+    whole history. Pass ``client`` to reuse an open ``TimeSeries`` session;
+    otherwise a fresh one is opened and closed around the call.
+    """
+    ts = client or make_client(api_key)
+    try:
+        data, meta_data = await ts.get_daily(symbol=symbol, outputsize=outputsize)
+    except ValueError as e:
+        if _is_throttle(e):
+            raise ThrottledError(str(e)) from e
+        if _is_unknown_symbol(e):
+            raise UnknownSymbolError(str(e)) from e
+        raise
+    finally:
+        if client is None:
+            await ts.close()  # Close the session
+    # Rename columns to match our previous format
+    data.columns = COLUMNS
+    return data.sort_index(ascending=True)
+
+
+class TokenBucket:
+    """Async token bucket: ``rate_per_minute`` calls, bursting up to ``capacity``."""
+
+    def __init__(self, rate_per_minute, capacity=1):
+        if rate_per_minute <= 0:
+            raise ValueError(f'Alpha Vantage call budget must be above 0 calls per minute, '
+                             f'got {rate_per_minute:g}')
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class FetchScheduler:
+    """Fetch many symbols concurrently within the plan's call budget.
+
+    All requests share one aiohttp session. A dispatcher takes a token
+    first and only then picks the most urgent queued job, so an
+    ``INTERACTIVE`` fetch queued behind ``BACKGROUND`` refreshes goes out on
+    the next call the plan allows. At most ``concurrency`` calls are in
+    flight. Throttling notes are retried with exponential backoff.
+    """
+
+    def __init__(self, api_key, calls_per_minute=ALPHA_VANTAGE_CALLS_PER_MINUTE,
+                 concurrency=4, max_retries=4, backoff=15.0, base_url=ALPHA_VANTAGE_BASE_URL):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.calls_per_minute = calls_per_minute
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.loop = None
+        self.error = None
+        self._seq = itertools.count()
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.bucket = TokenBucket(self.calls_per_minute)
+        self.queue = asyncio.PriorityQueue()
+        self.session = aiohttp.ClientSession()
+        self.client = make_client(self.api_key, self.base_url)
+        self.client.session = self.session
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._calls = set()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        return self
+
+    async def close(self):
+        tasks = [self._dispatcher, *self._calls]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.session.close()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def fetch(self, symbol, outputsize='compact', priority=INTERACTIVE):
+        if self.error is not None:
+            raise RuntimeError('Fetch scheduler stopped') from self.error
+        future = self.loop.create_future()
+        await self.queue.put((priority, next(self._seq), symbol, outputsize, future))
+        return await future
+
+    def fetch_threadsafe(self, symbol, outputsize='compact', priority=INTERACTIVE):
+        """``fetch`` for callers on another thread's event loop; returns an awaitable."""
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+            self.fetch(symbol, outputsize, priority), self.loop))
+
+    async def fetch_many(self, symbols, outputsize='compact', priority=BACKGROUND):
+        """Fetch every symbol; failed ones map to their exception."""
+        results = await asyncio.gather(*(self.fetch(s, outputsize, priority) for s in symbols),
+                                       return_exceptions=True)
+        return dict(zip(symbols, results))
+
+    async def refresh_many(self, symbols, cache=None, priority=BACKGROUND):
+        """Bring the OHLCV cache up to date for a whole watchlist."""
+        from .ohlcv_cache import load_daily
+
+        async def fetcher(symbol, outputsize='compact'):
+            return await self.fetch(symbol, outputsize, priority)
+
+        results = await asyncio.gather(
+            *(load_daily(s, self.api_key, cache=cache, fetcher=fetcher) for s in symbols),
+            return_exceptions=True)
+        return dict(zip(symbols, results))
+
+    async def _dispatch(self):
+        try:
+            await self._dispatch_jobs()
+        except Exception as e:
+            # Fail everything queued (and later fetch calls) rather than
+            # leaving callers waiting on a dispatcher that is gone
+            self.error = e
+            while not self.queue.empty():
+                future = self.queue.get_nowait()[-1]
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+    async def _dispatch_jobs(self):
+        while True:
+            await self._slots.acquire()
+            # Wait for work, then put it back: the job is chosen only once a
+            # call is allowed, so anything more urgent queued meanwhile wins
+            job = await self.queue.get()
+            while job[-1].cancelled():
+                job = await self.queue.get()
+            self.queue.put_nowait(job)
+            await self.bucket.acquire()
+            # Only the dispatcher takes jobs off the queue, so it isn't empty
+            call = asyncio.create_task(self._call(*self.queue.get_nowait()[2:]))
+            self._calls.add(call)
+            call.add_done_callback(self._calls.discard)
+
+    async def _call(self, symbol, outputsize, future):
+        try:
+            if future.cancelled():
+                return
+            result = await self._fetch_with_retry(symbol, outputsize)
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        else:
+            if not future.cancelled():
+                future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def _fetch_with_retry(self, symbol, outputsize):
+        # The dispatcher already took the first attempt's token
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await self.bucket.acquire()
+            try:
+                return await fetch_daily(symbol, self.api_key, outputsize, client=self.client)
+            except ThrottledError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+
+# ------------------ Process-wide scheduler ------------------ #
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def shared_scheduler(api_key):
+    """A started scheduler running on its own event-loop thread, one per API key.
+
+    Streamlit sessions each drive their own ``asyncio.run``; routing them
+    through ``fetch_threadsafe`` on this one scheduler keeps the whole
+    server within the app's share of the plan (``WEB_CALLS_PER_MINUTE``).
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(api_key)
+        if scheduler is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='av-fetch', daemon=True).start()
+            scheduler = FetchScheduler(api_key, calls_per_minute=WEB_CALLS_PER_MINUTE)
+            try:
+                asyncio.run_coroutine_threadsafe(scheduler.start(), loop).result()
+            except Exception:
+                # e.g. no budget left for the app after API_CALLS_PER_MINUTE
+                loop.call_soon_threadsafe(loop.stop)
+                raise
+            _schedulers[api_key] = scheduler
+    return scheduler
@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+
+from .config import INFERENCE_BACKEND, INFERENCE_THREADS, QUANTIZATION
+from .numpy_lstm import NumpyLSTM
+from .quantize import quantize_model
+
+BACKENDS = ('numpy', 'keras', 'tflite', 'onnx')
+
+# Windows per TFLite invoke; tools/export_model.py bakes this into the graph
+TFLITE_BATCH = 64
+
+# Backends whose predict() must not run from several threads at once
+STATEFUL_BACKENDS = ('keras', 'tflite')
+
+
+def exported_path(path, fmt, variant=None):
+    """Where tools/export_model.py puts the ``fmt`` export of ``path``.
+
+    Quantized variants get an infix, e.g. ``keras_model.int8.tflite``.
+    """
+    stem = os.path.splitext(path)[0]
+    return f'{stem}.{variant}.{fmt}' if variant else f'{stem}.{fmt}'
+
+
+class TFLiteModel:
+    """``predict`` over a TFLite flatbuffer via the standalone interpreter.
+
+    Uses the standalone ``ai_edge_litert`` or ``tflite_runtime`` interpreter
+    when installed (a few MB, no TensorFlow) and falls back to ``tf.lite``. The exported graph has a fixed batch size, so
+    inputs are fed in chunks of that size with the last one zero-padded.
+    The interpreter is not thread-safe; the registry serializes calls.
+    """
+
+    def __init__(self, path, num_threads=None):
+        try:
+            from ai_edge_litert.interpreter import Interpreter
+        except ImportError:
+            try:
+                from tflite_runtime.interpreter import Interpreter
+            except ImportError:
+                import tensorflow as tf
+                Interpreter = tf.lite.Interpreter
+        self.interpreter = Interpreter(model_path=path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.batch_size = int(self._input['shape'][0])
+
+    def predict(self, x, batch_size=None, verbose=0):
+        x = np.asarray(x, dtype=np.float32)
+        n, step = len(x), self.batch_size
+        out = np.empty((n, self._output['shape'][-1]), dtype=np.float32)
+        chunk = np.zeros(self._input['shape'], dtype=np.float32)
+        for start in range(0, n, step):
+            part = x[start:start + step]
+            chunk[:len(part)] = part
+            chunk[len(part):] = 0
+            self.interpreter.set_tensor(self._input['index'], chunk)
+            self.interpreter.invoke()
+            out[start:start + len(part)] = self.interpreter.get_tensor(self._output['index'])[:len(part)]
+        return out
+
+
+class OnnxModel:
+    """``predict`` over an ONNX graph with ONNX Runtime on CPU."""
+
+    def __init__(self, path, num_threads=None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self._input = self.session.get_inputs()[0].name
+
+    def predict(self, x, batch_size=None, verbose=0):
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        return self.session.run(None, {self._input: x})[0]
+
+
+def load_model(path, backend=None, num_threads=None, quantization=None):
+    """Load a model with the chosen inference backend.
+
+    ``numpy`` runs the forward pass without importing TensorFlow; ``keras``
+    is the reference implementation; ``tflite`` and ``onnx`` run the
+    exports from tools/export_model.py (``path`` may name the ``.keras``
+    file, the sibling export is used). All expose ``predict(x)``.
+
+    ``quantization`` (``int8`` or ``float16``) quantizes the NumPy weights
+    after loading, or picks the matching TFLite export.
+    """
+    backend = backend or INFERENCE_BACKEND
+    num_threads = num_threads or INFERENCE_THREADS
+    quantization = quantization if quantization is not None else QUANTIZATION
+    if quantization and backend not in ('numpy', 'tflite'):
+        raise ValueError(f"Quantized serving is available for the numpy and tflite backends, not {backend!r}")
+    if backend == 'numpy':
+        model = NumpyLSTM.from_keras_file(path)
+        return quantize_model(model, quantization) if quantization else model
+    if backend == 'keras':
+        from keras.models import load_model as keras_load_model
+        return keras_load_model(path)
+    if backend == 'tflite':
+        return TFLiteModel(_export_for(path, 'tflite', quantization), num_threads=num_threads)
+    if backend == 'onnx':
+        return OnnxModel(_export_for(path, 'onnx'), num_threads=num_threads)
+    raise ValueError(f"Unknown inference backend {backend!r}, expected one of {BACKENDS}")
+
+
+def _export_for(path, fmt, variant=None):
+    if path.endswith(f'.{fmt}'):
+        return path
+    exported = exported_path(path, fmt, variant)
+    if not os.path.exists(exported):
+        flags = f" --quantize {variant}" if variant else ""
+        raise FileNotFoundError(f"{exported} not found; run tools/export_model.py --format {fmt}{flags}")
+    return exported
@@ -0,0 +1,151 @@
+import io
+import json
+import zipfile
+
+import numpy as np
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _hard_sigmoid(x):
+    # Keras 3 definition, relu6(x + 3) / 6; Keras 2 used 0.2 * x + 0.5
+    return np.clip(x / 6.0 + 0.5, 0.0, 1.0)
+
+
+def _relu(x):
+    return np.maximum(x, 0.0)
+
+
+def _linear(x):
+    return x
+
+
+ACTIVATIONS = {
+    'sigmoid': _sigmoid,
+    'hard_sigmoid': _hard_sigmoid,
+    'relu': _relu,
+    'tanh': np.tanh,
+    'linear': _linear,
+    None: _linear,
+}
+
+
+class LSTMLayer:
+    """Weights of one Keras ``LSTM`` layer, gates packed as i, f, c, o."""
+
+    def __init__(self, kernel, recurrent_kernel, bias, activation='tanh',
+                 recurrent_activation='sigmoid', return_sequences=False):
+        self.kernel = kernel
+        self.recurrent_kernel = recurrent_kernel
+        self.bias = bias
+        self.units = recurrent_kernel.shape[0]
+        self.activation = ACTIVATIONS[activation]
+        self.recurrent_activation = ACTIVATIONS[recurrent_activation]
+        self.return_sequences = return_sequences
+
+    def initial_state(self, batch):
+        zeros = np.zeros((batch, self.units), dtype=self.recurrent_kernel.dtype)
+        return zeros, zeros.copy()
+
+    def step(self, z, h, c):
+        """Advance one timestep given the input projection ``z = x @ W + b``."""
+        u = self.units
+        z = z + h @ self.recurrent_kernel
+        i = self.recurrent_activation(z[:, :u])
+        f = self.recurrent_activation(z[:, u:2 * u])
+        g = self.activation(z[:, 2 * u:3 * u])
+        o = self.recurrent_activation(z[:, 3 * u:])
+        c = f * c + i * g
+        h = o * self.activation(c)
+        return h, c
+
+    def run(self, x, state=None):
+        """Run the whole sequence; returns the layer output and the final ``(h, c)``."""
+        n, steps, _ = x.shape
+        # The input projection has no recurrence, so do it for every step at once
+        z = x @ self.kernel + self.bias
+        h, c = state if state is not None else self.initial_state(n)
+        outputs = np.empty((n, steps, self.units), dtype=h.dtype) if self.return_sequences else None
+        for t in range(steps):
+            h, c = self.step(z[:, t], h, c)
+            if outputs is not None:
+                outputs[:, t] = h
+        return (outputs if outputs is not None else h), (h, c)
+
+    def __call__(self, x):
+        return self.run(x)[0]
+
+
+class DenseLayer:
+    def __init__(self, kernel, bias, activation=None):
+        self.kernel = kernel
+        self.bias = bias
+        self.activation = ACTIVATIONS[activation]
+
+    def __call__(self, x):
+        return self.activation(x @ self.kernel + self.bias)
+
+
+class NumpyLSTM:
+    """Stacked LSTM + Dense forward pass in plain NumPy.
+
+    Mirrors ``model.predict`` of the Sequential model built in
+    Lstm_model.ipynb. Dropout is a no-op at inference and is skipped.
+    """
+
+    def __init__(self, layers, dtype=np.float32):
+        self.layers = layers
+        self.dtype = dtype
+
+    @classmethod
+    def from_keras_file(cls, path, dtype=np.float32):
+        """Read architecture and weights out of a ``.keras`` archive."""
+        import h5py
+
+        with zipfile.ZipFile(path) as archive:
+            config = json.loads(archive.read('config.json'))
+            weights_file = io.BytesIO(archive.read('model.weights.h5'))
+            with h5py.File(weights_file, 'r') as weights:
+                layers = [_build_layer(layer, weights, dtype)
+                          for layer in config['config']['layers']]
+        return cls([layer for layer in layers if layer is not None], dtype=dtype)
+
+    @property
+    def input_shape(self):
+        return (None, None, self.layers[0].kernel.shape[0])
+
+    def predict(self, x, batch_size=None, verbose=0):
+        """Same contract as Keras: ``(n, steps, features)`` in, ``(n, 1)`` out."""
+        x = np.asarray(x, dtype=self.dtype)
+        if batch_size is None or batch_size >= len(x):
+            return self._forward(x)
+        return np.concatenate([self._forward(x[i:i + batch_size])
+                               for i in range(0, len(x), batch_size)])
+
+    def _forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+
+def _build_layer(layer, weights, dtype):
+    kind = layer['class_name']
+    config = layer['config']
+    if kind == 'LSTM':
+        group = weights[f"layers/{config['name']}/cell/vars"]
+        kernel, recurrent_kernel = group['0'][()], group['1'][()]
+        bias = group['2'][()] if config.get('use_bias', True) else np.zeros(kernel.shape[1])
+        return LSTMLayer(kernel.astype(dtype), recurrent_kernel.astype(dtype), bias.astype(dtype),
+                         activation=config['activation'],
+                         recurrent_activation=config['recurrent_activation'],
+                         return_sequences=config['return_sequences'])
+    if kind == 'Dense':
+        group = weights[f"layers/{config['name']}/vars"]
+        kernel = group['0'][()]
+        bias = group['1'][()] if config.get('use_bias', True) else np.zeros(kernel.shape[1])
+        return DenseLayer(kernel.astype(dtype), bias.astype(dtype), config['activation'])
+    if kind in ('InputLayer', 'Dropout'):
+        return None
+    raise ValueError(f"Unsupported layer for NumPy inference: {kind}")
@@ -0,0 +1,125 @@
+import datetime
+import functools
+import os
+import re
+import tempfile
+
+import pandas as pd
+
+from .config import CACHE_DIR
+from .fetch import fetch_daily
+
+
+def _last_closed_session(today):
+    """Most recent weekday strictly before ``today``.
+
+    Today's bar is still moving until the close, so the newest bar we expect
+    to have for good is the previous trading day.
+    """
+    day = today - datetime.timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= datetime.timedelta(days=1)
+    return day
+
+
+def ticker_key(symbol):
+    """Normalized, filesystem-safe form of a ticker symbol."""
+    return re.sub(r'[^A-Z0-9._-]', '_', symbol.strip().upper())
+
+
+def write_atomic(path, write, suffix='.tmp'):
+    """Create ``path`` via ``write(tmp_path)`` and a rename over it.
+
+    The temporary file is unique to this writer, so processes sharing the
+    cache directory (app, API, load-test workers) never write into the same
+    one. Readers see the old file or the new one, never a partial write.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path),
+                               prefix=f'{os.path.basename(path)}.', suffix=suffix)
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class OHLCVCache:
+    """One Parquet file of daily bars per ticker."""
+
+    def __init__(self, root=None):
+        self.root = os.path.join(root or CACHE_DIR, 'ohlcv')
+
+    def path(self, symbol):
+        return os.path.join(self.root, f'{ticker_key(symbol)}.parquet')
+
+    def load(self, symbol):
+        path = self.path(symbol)
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)
+
+    def save(self, symbol, df):
+        os.makedirs(self.root, exist_ok=True)
+        write_atomic(self.path(symbol), df.to_parquet)
+
+    def checked_on(self, symbol):
+        """Local date the ticker was last refreshed from the API."""
+        mtime = os.path.getmtime(self.path(symbol))
+        return datetime.date.fromtimestamp(mtime)
+
+    def is_fresh(self, symbol, df, today=None):
+        today = today or datetime.date.today()
+        last = df.index.max().date()
+        # A bar saved on its own day may be a partial one (caches written
+        # before load_daily dropped those); fetch again to get the final close
+        if last >= _last_closed_session(today) and self.checked_on(symbol) > last:
+            return True
+        # Holidays: nothing new upstream, so one check per day is enough
+        return self.checked_on(symbol) >= today
+
+
+def closed_bars(df, today=None):
+    """``df`` without bars dated ``today`` or later, whose close is still moving."""
+    today = today or datetime.date.today()
+    return df[df.index < pd.Timestamp(today)]
+
+
+def merge_bars(cached, fresh):
+    """Append ``fresh`` bars to ``cached``; overlapping dates take the fresh row."""
+    merged = pd.concat([cached, fresh])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index(ascending=True)
+
+
+async def load_daily(symbol, api_key, cache=None, fetcher=None):
+    """Daily bars for ``symbol``, served from the local cache when possible.
+
+    A cold ticker costs one ``outputsize='full'`` call. After that only the
+    last 100 bars (``'compact'``) are fetched, at most once a day, and
+    appended to what is on disk. Today's bar is left out until a later
+    fetch, once it has closed. ``fetcher(symbol, outputsize=...)`` defaults
+    to a direct ``fetch_daily`` call.
+    """
+    cache = cache or OHLCVCache()
+    fetcher = fetcher or functools.partial(fetch_daily, api_key=api_key)
+    cached = cache.load(symbol)
+    if cached is not None and cache.is_fresh(symbol, cached):
+        return cached
+
+    if cached is None:
+        df = await fetcher(symbol, outputsize='full')
+    else:
+        fresh = await fetcher(symbol, outputsize='compact')
+        if fresh.index.min() > cached.index.max():
+            # Gap is wider than the compact window; start over
+            df = await fetcher(symbol, outputsize='full')
+        else:
+            df = merge_bars(cached, fresh)
+
+    # Cached bars are final: is_fresh and the prediction store never revisit them
+    df = closed_bars(df)
+    if not df.empty:
+        cache.save(symbol, df)
+    return df
@@ -0,0 +1,40 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .config import WINDOW
+from .scaling import MinMaxParams
+from .windows import make_windows
+
+# Share of the history the scaler is fitted on; the rest is the test span
+TRAIN_FRACTION = 0.7
+
+TestWindows = namedtuple('TestWindows', ['x', 'y', 'end_dates', 'scaler'])
+
+
+def split_train_test(close, train_fraction=TRAIN_FRACTION):
+    split = int(len(close) * train_fraction)
+    return close[:split], close[split:]
+
+
+def fit_scaler(train):
+    return MinMaxParams.fit(train)
+
+
+def moving_averages(close, windows=(100, 200)):
+    return tuple(close.rolling(w).mean() for w in windows)
+
+
+def prepare_test_windows(close, scaler=None, window=WINDOW):
+    """Scale the test span of ``close`` and cut it into model windows.
+
+    The first test window reaches ``window`` bars back into the training
+    span. ``end_dates[i]`` is the date of the last bar in ``x[i]``.
+    """
+    train, test = split_train_test(close)
+    scaler = scaler or fit_scaler(train)
+    final = pd.concat([train.tail(window), test])
+    scaled = scaler.transform(np.asarray(final).reshape(-1, 1))
+    x, y = make_windows(scaled, window=window)
+    return TestWindows(x, y, final.index[window - 1:-1], scaler)
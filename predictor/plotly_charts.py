@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from .downsample import downsample
+
+# Same chart set as predictor.charts, drawn in the browser with WebGL traces.
+# Every series is reduced with LTTB before it goes into the page; the budget
+# is higher than for the rasters so zooming in still shows detail.
+MAX_POINTS = 4000
+
+HEIGHT = 450
+
+
+def _trace(series, name, max_points, **kwargs):
+    if not isinstance(series, pd.Series):
+        series = np.asarray(series).reshape(-1)
+    series = downsample(series, max_points)
+    x = series.index if isinstance(series, pd.Series) else None
+    return go.Scattergl(x=x, y=series, name=name, mode='lines', **kwargs)
+
+
+def _figure(traces, title=None, xaxis='Date', yaxis='Price'):
+    fig = go.Figure(traces)
+    fig.update_layout(title=title, xaxis_title=xaxis, yaxis_title=yaxis, height=HEIGHT,
+                      margin=dict(l=40, r=20, t=50 if title else 20, b=40))
+    return fig
+
+
+def line_chart(title, *series, max_points=MAX_POINTS):
+    return _figure([_trace(data, getattr(data, 'name', None), max_points) for data in series],
+                   title)
+
+
+def moving_average_chart(close, title, averages, close_alpha=0.8, max_points=MAX_POINTS):
+    """Closing price with one or more ``(series, label, color)`` moving averages."""
+    traces = [_trace(close, 'Closing Price', max_points, opacity=close_alpha)]
+    for ma, label, color in averages:
+        traces.append(_trace(ma, label, max_points, line=dict(color=color, width=2)))
+    fig = _figure(traces, title, yaxis='Price ($)')
+    fig.update_yaxes(range=[0, 1550])
+    return fig
+
+
+def prediction_chart(y_test, y_predicted, max_points=MAX_POINTS):
+    return _figure([_trace(y_test, 'Actual Price', max_points, line=dict(color='green')),
+                    _trace(y_predicted, 'Predicted Price', max_points, line=dict(color='red'))],
+                   xaxis='Time', yaxis='Stock Price')
+
+
+def volume_chart(volume, max_points=MAX_POINTS):
+    return _figure([_trace(volume, 'Volume', max_points, fill='tozeroy',
+                           line=dict(color='purple'), fillcolor='rgba(128, 0, 128, 0.2)')],
+                   yaxis='Volume')
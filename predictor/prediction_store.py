@@ -0,0 +1,67 @@
+import functools
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import CACHE_DIR
+from .ohlcv_cache import ticker_key, write_atomic
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path, mtime):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def model_version(path):
+    """Content hash of a model artifact, recomputed only when the file changes."""
+    return _file_digest(os.path.abspath(path), os.path.getmtime(path))
+
+
+class PredictionStore:
+    """Raw model outputs per (ticker, model version), indexed by window end date."""
+
+    def __init__(self, root=None):
+        self.root = os.path.join(root or CACHE_DIR, 'predictions')
+
+    def path(self, ticker, version):
+        return os.path.join(self.root, version, f'{ticker_key(ticker)}.parquet')
+
+    def load(self, ticker, version):
+        path = self.path(ticker, version)
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)['prediction']
+
+    def save(self, ticker, version, predictions):
+        path = self.path(ticker, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, predictions.rename('prediction').to_frame().to_parquet)
+
+
+def predict_incremental(model, ticker, version, x, end_dates, store=None):
+    """``model.predict(x)``, reusing every window already predicted for this key.
+
+    ``end_dates[i]`` is the date of the last bar in window ``x[i]``. Only
+    windows whose end date is not in the store are run through the model,
+    which after the first view is just the bars that arrived since.
+    """
+    if not len(x):
+        # History too short for a test window (new listings)
+        return np.empty((0, 1))
+    store = store or PredictionStore()
+    end_dates = pd.DatetimeIndex(end_dates)
+    cached = store.load(ticker, version)
+    missing = np.ones(len(end_dates), dtype=bool) if cached is None else ~end_dates.isin(cached.index)
+
+    if missing.any():
+        fresh = pd.Series(np.asarray(model.predict(x[missing])).reshape(-1), index=end_dates[missing])
+        cached = fresh if cached is None else pd.concat([cached, fresh]).sort_index()
+        store.save(ticker, version, cached)
+
+    return cached.reindex(end_dates).to_numpy().reshape(-1, 1)
@@ -0,0 +1,113 @@
+import numpy as np
+
+from .numpy_lstm import DenseLayer, LSTMLayer, NumpyLSTM
+
+MODES = ('int8', 'float16')
+
+
+class QuantizedTensor:
+    """Weights stored as int8 (symmetric, one scale per output column) or float16."""
+
+    def __init__(self, weights, mode):
+        if mode == 'int8':
+            scale = np.abs(weights).max(axis=0) / 127.0
+            scale[scale == 0] = 1.0
+            self.values = np.round(weights / scale).astype(np.int8)
+            self.scale = scale.astype(np.float32)
+        elif mode == 'float16':
+            self.values = weights.astype(np.float16)
+            self.scale = None
+        else:
+            raise ValueError(f"Unknown quantization mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + (self.scale.nbytes if self.scale is not None else 0)
+
+    def dequantize(self, dtype=np.float32):
+        values = self.values.astype(dtype)
+        return values * self.scale if self.scale is not None else values
+
+
+class QuantizedLSTMLayer(LSTMLayer):
+    """``LSTMLayer`` whose kernels stay quantized between calls.
+
+    ``run`` expands them to float32 once per call, so the recurrent loop is
+    the same float math as the unquantized layer; only resident weight
+    memory shrinks.
+    """
+
+    def __init__(self, layer, mode):
+        self._kernel = QuantizedTensor(layer.kernel, mode)
+        self._recurrent_kernel = QuantizedTensor(layer.recurrent_kernel, mode)
+        self.bias = layer.bias
+        self.units = layer.units
+        self.activation = layer.activation
+        self.recurrent_activation = layer.recurrent_activation
+        self.return_sequences = layer.return_sequences
+
+    @property
+    def kernel(self):
+        return self._kernel.dequantize()
+
+    @property
+    def recurrent_kernel(self):
+        return self._recurrent_kernel.dequantize()
+
+    @property
+    def nbytes(self):
+        return self._kernel.nbytes + self._recurrent_kernel.nbytes + self.bias.nbytes
+
+    def run(self, x, state=None):
+        expanded = LSTMLayer.__new__(LSTMLayer)
+        expanded.__dict__.update(self.__dict__)
+        expanded.kernel, expanded.recurrent_kernel = self.kernel, self.recurrent_kernel
+        return expanded.run(x, state)
+
+
+class QuantizedDenseLayer(DenseLayer):
+    def __init__(self, layer, mode):
+        self._kernel = QuantizedTensor(layer.kernel, mode)
+        self.bias = layer.bias
+        self.activation = layer.activation
+
+    @property
+    def kernel(self):
+        return self._kernel.dequantize()
+
+    @property
+    def nbytes(self):
+        return self._kernel.nbytes + self.bias.nbytes
+
+
+def quantize_model(model, mode):
+    """Post-training weight quantization of a ``NumpyLSTM``.
+
+    Biases stay float32; activations are computed in float32, so no
+    calibration pass is needed for either mode.
+    """
+    layers = []
+    for layer in model.layers:
+        if isinstance(layer, LSTMLayer):
+            layers.append(QuantizedLSTMLayer(layer, mode))
+        elif isinstance(layer, DenseLayer):
+            layers.append(QuantizedDenseLayer(layer, mode))
+        else:
+            layers.append(layer)
+    quantized = NumpyLSTM(layers, dtype=model.dtype)
+    quantized.quantization = mode
+    return quantized
+
+
+def weight_nbytes(model):
+    """Resident bytes of a ``NumpyLSTM``'s weights, quantized or not."""
+    total = 0
+    for layer in model.layers:
+        if hasattr(layer, 'nbytes'):
+            total += layer.nbytes
+        elif isinstance(layer, LSTMLayer):
+            total += layer.kernel.nbytes + layer.recurrent_kernel.nbytes + layer.bias.nbytes
+        else:
+            total += layer.kernel.nbytes + layer.bias.nbytes
+    return total
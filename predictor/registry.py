@@ -0,0 +1,126 @@
+import os
+import threading
+
+import numpy as np
+
+from .batching import MicroBatcher
+from .bundle import ModelBundle
+from .config import (BATCH_MAX_SIZE, BUNDLE_PATH, INFERENCE_BACKEND, MODEL_PATH, POOL_SIZE,
+                     QUANTIZATION, WINDOW)
+from .inference import STATEFUL_BACKENDS, load_model
+
+# One entry per (artifact, backend, quantization) for the whole process. Streamlit
+# reruns the script for every interaction and every session, but imports this
+# module once.
+_models = {}
+_lock = threading.Lock()
+_bundles = {}
+_bundles_lock = threading.Lock()
+
+
+class SharedModel:
+    """Thread-safe handle around a loaded model.
+
+    The NumPy and ONNX Runtime backends are safe to call concurrently and run
+    unlocked; Keras ``predict`` and the TFLite interpreter are serialized
+    because they are not safe to call from several Streamlit session threads
+    at once.
+
+    With ``batch_size > 0`` (``PREDICTOR_BATCH_MAX_SIZE``) calls from
+    concurrent sessions go through a ``MicroBatcher`` and share forward passes.
+    ``model`` may be an ``InferencePool``, which needs no lock and lets the
+    batcher keep one pass in flight per worker (``InferencePool.size``).
+    """
+
+    def __init__(self, model, backend, batch_size=BATCH_MAX_SIZE):
+        self.model = model
+        self.backend = backend
+        serialize = backend in STATEFUL_BACKENDS and not getattr(model, 'thread_safe', False)
+        self._lock = threading.Lock() if serialize else None
+        submit = getattr(model, 'submit', None)
+        # One pass per pool worker; more would only queue behind them
+        self.batcher = MicroBatcher(submit or self._predict, max_batch=batch_size,
+                                    max_in_flight=model.size if submit else 1) if batch_size else None
+
+    def predict(self, x, **kwargs):
+        if self.batcher is not None:
+            return self.batcher.predict(x)
+        return self._predict(x, **kwargs)
+
+    def _predict(self, x, **kwargs):
+        kwargs.setdefault('verbose', 0)
+        if self._lock is None:
+            return self.model.predict(x, **kwargs)
+        with self._lock:
+            return self.model.predict(x, **kwargs)
+
+
+def warm_up(model, window=WINDOW):
+    """Run one dummy batch so graph tracing happens before the first real request."""
+    model.predict(np.zeros((1, window, 1), dtype=np.float32), verbose=0)
+
+
+def _key(path, backend):
+    return os.path.abspath(path), backend or INFERENCE_BACKEND, QUANTIZATION
+
+
+def _load(path, backend):
+    if POOL_SIZE:
+        # Inference in PREDICTOR_POOL_SIZE worker processes, off the web tier's GIL
+        from .worker_pool import InferencePool
+
+        return InferencePool(path, backend=backend).start()
+    return load_model(path, backend=backend)
+
+
+def get_model(path=MODEL_PATH, backend=None):
+    """Load ``path`` once per process, warm it up and hand out the shared instance."""
+    backend = backend or INFERENCE_BACKEND
+    key = _key(path, backend)
+    model = _models.get(key)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            model = SharedModel(_load(path, backend), backend)
+            warm_up(model)
+            _models[key] = model
+    return model
+
+
+def get_bundle(path=BUNDLE_PATH):
+    """The serving bundle, read once per process.
+
+    Falls back to ``MODEL_PATH`` without a stored scaler when no bundle has
+    been built. Pair with ``get_model(bundle.model_path)`` for the model.
+    """
+    key = os.path.abspath(path)
+    with _bundles_lock:
+        bundle = _bundles.get(key)
+        if bundle is None:
+            if os.path.exists(path):
+                bundle = ModelBundle.load(path)
+            else:
+                bundle = ModelBundle.from_model(MODEL_PATH)
+            _bundles[key] = bundle
+    return bundle
+
+
+def preload(path=MODEL_PATH, backend=None):
+    """Start loading in the background; a later ``get_model`` joins it.
+
+    Errors are left for that ``get_model`` call to raise.
+    """
+    if _key(path, backend) in _models or _lock.locked():
+        return None
+
+    def _load():
+        try:
+            get_model(path, backend)
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_load, name='model-preload', daemon=True)
+    thread.start()
+    return thread
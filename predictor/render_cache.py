@@ -0,0 +1,81 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+from .config import RENDER_CACHE_BYTES
+
+# Rasterization settings are part of what a cached image means
+DPI = 100
+
+
+def chart_key(data_key, chart, size, *extra):
+    """Fingerprint of one rendered chart.
+
+    ``data_key`` identifies the data (ticker, last bar date, bar count),
+    ``chart`` the chart type and ``size`` its figsize; ``extra`` covers
+    anything else the picture depends on, e.g. the model version.
+    """
+    raw = repr((tuple(str(part) for part in data_key), chart, tuple(size), DPI, extra))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def figure_bytes(fig, fmt='png'):
+    """Rasterize (or serialize, for SVG) a figure and release its artists."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=DPI, bbox_inches='tight')
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+class RenderCache:
+    """Size-bounded LRU of rendered chart bytes, shared by all sessions."""
+
+    def __init__(self, max_bytes=RENDER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            self._entries[key] = data
+            self.nbytes += len(data)
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def render(self, key, draw, fmt='png'):
+        """Cached bytes for ``key`` in ``fmt``, calling ``draw()`` for a figure on a miss."""
+        # The PNG and the SVG of one chart are separate entries
+        key = f'{key}.{fmt}'
+        data = self.get(key)
+        if data is None:
+            data = figure_bytes(draw(), fmt)
+            self.put(key, data)
+        return data
+
+    def __len__(self):
+        return len(self._entries)
+
+
+render_cache = RenderCache()
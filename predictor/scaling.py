@@ -0,0 +1,67 @@
+import hashlib
+
+import numpy as np
+
+
+class MinMaxParams:
+    """Fitted min-max scaling for a single feature, as plain NumPy.
+
+    Matches ``sklearn.preprocessing.MinMaxScaler`` (and keeps its
+    ``data_min_``/``data_max_``/``scale_``/``min_`` attributes) but is just
+    two numbers, so it serializes into a model bundle and transforms with
+    one multiply-add.
+    """
+
+    def __init__(self, data_min, data_max, feature_range=(0.0, 1.0)):
+        self.data_min = float(data_min)
+        self.data_max = float(data_max)
+        self.feature_range = tuple(float(v) for v in feature_range)
+        low, high = self.feature_range
+        data_range = self.data_max - self.data_min
+        # Constant series: sklearn treats a zero range as 1
+        self.scale = (high - low) / (data_range if data_range else 1.0)
+        self.offset = low - self.data_min * self.scale
+
+    @classmethod
+    def fit(cls, values, feature_range=(0.0, 1.0)):
+        values = np.asarray(values, dtype=np.float64)
+        return cls(np.nanmin(values), np.nanmax(values), feature_range)
+
+    @classmethod
+    def from_dict(cls, params):
+        return cls(params['data_min'], params['data_max'], params.get('feature_range', (0.0, 1.0)))
+
+    def to_dict(self):
+        return {'data_min': self.data_min, 'data_max': self.data_max,
+                'feature_range': list(self.feature_range)}
+
+    def transform(self, values):
+        return np.asarray(values, dtype=np.float64) * self.scale + self.offset
+
+    def inverse_transform(self, values):
+        return (np.asarray(values, dtype=np.float64) - self.offset) / self.scale
+
+    def fingerprint(self):
+        params = np.array([self.data_min, self.data_max, *self.feature_range])
+        return hashlib.sha1(params.tobytes()).hexdigest()[:8]
+
+    # sklearn-style attribute names, for code written against MinMaxScaler
+
+    @property
+    def data_min_(self):
+        return np.array([self.data_min])
+
+    @property
+    def data_max_(self):
+        return np.array([self.data_max])
+
+    @property
+    def scale_(self):
+        return np.array([self.scale])
+
+    @property
+    def min_(self):
+        return np.array([self.offset])
+
+    def __repr__(self):
+        return f"MinMaxParams(data_min={self.data_min:g}, data_max={self.data_max:g})"
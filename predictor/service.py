@@ -0,0 +1,79 @@
+import contextlib
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .config import QUANTIZATION
+from .pipeline import prepare_test_windows
+from .prediction_store import predict_incremental
+from .singleflight import flights
+
+# The stages after the fetch, shared by app.py and the HTTP API (api.py)
+
+PredictedSpan = namedtuple('PredictedSpan', ['dates', 'actual', 'predicted', 'model_key'])
+
+TRENDS = ('strong_uptrend', 'potential_uptrend', 'strong_downtrend', 'potential_downtrend')
+
+
+def _no_span(stage, **fields):
+    return contextlib.nullcontext()
+
+
+def model_key(bundle, scaler):
+    """Prediction-store key: model version, quantization and scaler."""
+    # Quantized weights give slightly different outputs, so they get their own entries
+    return f"{bundle.version}{QUANTIZATION and '-' + QUANTIZATION}-{scaler.fingerprint()}"
+
+
+def predict_test_span(model, bundle, ticker, close, data_key, span=_no_span):
+    """Predicted vs actual closes over the test span, in price units.
+
+    ``dates[i]`` is the bar whose close ``predicted[i]`` forecasts. Windows
+    already in the prediction store are not run again, and concurrent calls
+    for the same data share one run. ``span(stage, **fields)`` wraps the
+    windowing and predict stages, e.g. ``StageTimer.span``.
+    """
+    # The bundle's fitted scaler for its training ticker, min/max of the 70%
+    # training span for any other; either way nothing is refit with sklearn
+    scaler = bundle.scaler_for(ticker, close)
+    with span('windowing'):
+        x, y, end_dates, scaler = prepare_test_windows(close, scaler=scaler, window=bundle.window)
+
+    # Only windows ending after the last cached one go through the model
+    key = model_key(bundle, scaler)
+    with span('predict', windows=len(x)):
+        y_predicted = flights.do(('predict', key) + tuple(data_key), predict_incremental,
+                                 model, ticker, key, x, end_dates)
+
+    # Reverse scaling
+    return PredictedSpan(close.index[len(close) - len(y):], scaler.inverse_transform(y).reshape(-1),
+                         scaler.inverse_transform(y_predicted).reshape(-1), key)
+
+
+def trend_signal(price, ma100, ma200):
+    """One of ``TRENDS`` for a price and its 100/200-day moving averages."""
+    if ma100 > ma200:
+        return 'strong_uptrend' if price > ma100 else 'potential_uptrend'
+    return 'strong_downtrend' if price < ma100 else 'potential_downtrend'
+
+
+def last_crossover(ma100, ma200):
+    """``(date, 'golden' | 'death')`` of the latest MA100/MA200 cross, or None."""
+    above = (ma100 > ma200)[ma200.notna()]
+    values = above.to_numpy()
+    flips = np.flatnonzero(values[1:] != values[:-1]) + 1
+    if not len(flips):
+        return None
+    i = flips[-1]
+    return above.index[i], 'golden' if values[i] else 'death'
+
+
+def signal_frame(close, ma100, ma200):
+    """Close, moving averages and trend per bar, for bars where both MAs exist."""
+    frame = pd.DataFrame({'close': close, 'ma100': ma100, 'ma200': ma200}).dropna()
+    up = frame['ma100'] > frame['ma200']
+    # Same cases, in the same order, as trend_signal
+    frame['trend'] = np.select([up & (frame['close'] > frame['ma100']), up,
+                                frame['close'] < frame['ma100']], TRENDS[:3], TRENDS[3])
+    return frame
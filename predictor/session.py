@@ -0,0 +1,58 @@
+from .ohlcv_cache import ticker_key
+
+
+def data_key(ticker, df):
+    """Identity of one fetched frame: ticker, last bar date and bar count."""
+    return (ticker_key(ticker), df.index[-1], len(df))
+
+
+class TickerSession:
+    """One user's fetched frame and everything derived from it.
+
+    ``state`` is ``st.session_state`` in the app (any mutable mapping works).
+    A single ticker is held at a time: asking for a different ticker drops
+    the stored frame, and storing a frame with new bars drops the derived
+    results (indicators, predictions) computed from the old one, so reruns
+    triggered by widgets reuse them without refetching or re-predicting.
+    """
+
+    def __init__(self, state, slot='ticker_data'):
+        self._state = state
+        self._slot = slot
+
+    @property
+    def _entry(self):
+        return self._state.get(self._slot)
+
+    def frame(self, ticker):
+        """The stored frame for ``ticker``, or None."""
+        entry = self._entry
+        if entry is None:
+            return None
+        if entry['ticker'] != ticker_key(ticker):
+            self.clear()
+            return None
+        return entry['frame']
+
+    def store(self, ticker, df):
+        key = data_key(ticker, df)
+        entry = self._entry
+        if entry is not None and entry['data_key'] == key:
+            # No new bars: keep the frame and the results derived from it
+            return
+        self._state[self._slot] = {'ticker': ticker_key(ticker), 'data_key': key,
+                                   'frame': df, 'derived': {}}
+
+    @property
+    def data_key(self):
+        return self._entry['data_key']
+
+    def memo(self, name, compute, *args, **kwargs):
+        """``compute(*args, **kwargs)``, once per stored frame and ``name``."""
+        derived = self._entry['derived']
+        if name not in derived:
+            derived[name] = compute(*args, **kwargs)
+        return derived[name]
+
+    def clear(self):
+        self._state.pop(self._slot, None)
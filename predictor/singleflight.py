@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the work; callers arriving while it is
+    in flight wait for and share its result (or exception). Nothing is
+    cached afterwards: the next call after completion runs again.
+
+    Streamlit runs each session on its own thread with its own event loop,
+    so waiting goes through a thread-safe ``concurrent.futures.Future``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def _join(self, key):
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _finish(self, key, future, fn):
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def do(self, key, fn, *args, **kwargs):
+        future, leader = self._join(key)
+        if leader:
+            self._finish(key, future, lambda: fn(*args, **kwargs))
+        return future.result()
+
+    async def do_async(self, key, fn, *args, **kwargs):
+        """Like ``do`` for a coroutine function; waiters may be on any event loop."""
+        future, leader = self._join(key)
+        if leader:
+            try:
+                future.set_result(await fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+        return await asyncio.wrap_future(future)
+
+    def in_flight(self):
+        with self._lock:
+            return list(self._calls)
+
+
+# Shared by every session of the server process
+flights = SingleFlight()
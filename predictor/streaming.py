@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+
+from .config import CACHE_DIR, MODEL_PATH
+from .numpy_lstm import LSTMLayer, NumpyLSTM
+from .ohlcv_cache import ticker_key, write_atomic
+from .prediction_store import model_version
+
+
+class TickerState:
+    """Per-layer ``(h, c)`` vectors for one ticker plus where the stream is at."""
+
+    def __init__(self, layers, last_date=None, steps=0):
+        self.layers = layers
+        self.last_date = last_date
+        self.steps = steps
+
+
+class StreamingLSTM:
+    """Advance the LSTM by one step per new close instead of re-running 100.
+
+    ``prime`` runs a full window from a zero state, exactly like
+    ``model.predict``, and keeps each layer's final hidden and cell state.
+    Every ``step`` after that costs one recurrent step per layer. The model
+    was trained on 100-bar windows, so predictions drift from the windowed
+    ones the longer a stream runs; re-prime (e.g. daily) to bound that.
+
+    States are checkpointed to ``.cache/streaming/<model version>/`` so a
+    restarted process resumes where it left off.
+    """
+
+    def __init__(self, model, version, root=None):
+        self.model = model
+        self.version = version
+        self.root = os.path.join(root or CACHE_DIR, 'streaming', version)
+        self.states = {}
+        self._lstm = [layer for layer in model.layers if isinstance(layer, LSTMLayer)]
+        self._head = [layer for layer in model.layers if not isinstance(layer, LSTMLayer)]
+
+    @classmethod
+    def from_path(cls, path=MODEL_PATH, root=None):
+        return cls(NumpyLSTM.from_keras_file(path), model_version(path), root=root)
+
+    def prime(self, ticker, window, last_date=None):
+        """Start (or restart) the stream from a scaled ``(steps,)`` window."""
+        x = np.asarray(window, dtype=self.model.dtype).reshape(1, -1, 1)
+        layers = []
+        for layer in self._lstm:
+            x, state = layer.run(x)
+            layers.append(state)
+        self.states[ticker_key(ticker)] = TickerState(layers, last_date)
+        return float(self._apply_head(x)[0, 0])
+
+    def step(self, ticker, value, date=None):
+        """Feed one new scaled close; returns the prediction for the next bar."""
+        return self.step_many({ticker: value}, date=date)[ticker]
+
+    def step_many(self, values, date=None):
+        """Advance many tickers at once, stacked into one batch per layer."""
+        tickers = list(values)
+        missing = [t for t in tickers if ticker_key(t) not in self.states]
+        if missing:
+            raise KeyError(f"No stream state for {', '.join(missing)}; call prime() or load() first")
+        states = [self.states[ticker_key(t)] for t in tickers]
+        x = np.asarray([values[t] for t in tickers], dtype=self.model.dtype).reshape(-1, 1)
+        for i, layer in enumerate(self._lstm):
+            h = np.concatenate([s.layers[i][0] for s in states])
+            c = np.concatenate([s.layers[i][1] for s in states])
+            h, c = layer.step(x @ layer.kernel + layer.bias, h, c)
+            for row, s in enumerate(states):
+                s.layers[i] = (h[row:row + 1], c[row:row + 1])
+            x = h
+        for s in states:
+            s.steps += 1
+            s.last_date = date if date is not None else s.last_date
+        out = self._apply_head(x)
+        return {t: float(out[row, 0]) for row, t in enumerate(tickers)}
+
+    def _apply_head(self, x):
+        for layer in self._head:
+            x = layer(x)
+        return x
+
+    # ------------------ Checkpoints ------------------ #
+
+    def path(self, ticker):
+        return os.path.join(self.root, f'{ticker_key(ticker)}.npz')
+
+    def save(self, ticker):
+        state = self.states[ticker_key(ticker)]
+        arrays = {}
+        for i, (h, c) in enumerate(state.layers):
+            arrays[f'h{i}'], arrays[f'c{i}'] = h, c
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(ticker)
+        write_atomic(path, lambda tmp: np.savez(tmp, steps=state.steps,
+                                                last_date=str(state.last_date or ''), **arrays),
+                     suffix='.tmp.npz')
+
+    def load(self, ticker):
+        """Restore a checkpointed state; returns ``False`` if there is none."""
+        path = self.path(ticker)
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as saved:
+            layers = [(saved[f'h{i}'], saved[f'c{i}']) for i in range(len(self._lstm))]
+            last_date = str(saved['last_date']) or None
+            self.states[ticker_key(ticker)] = TickerState(layers, last_date, int(saved['steps']))
+        return True
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from .numpy_lstm import DenseLayer, LSTMLayer, NumpyLSTM
+
+
+def gbm_ohlcv(bars, start_price=100.0, mu=0.08, sigma=0.25, end=None, seed=0, freq='B'):
+    """Synthetic daily OHLCV bars from geometric Brownian motion.
+
+    ``mu``/``sigma`` are annualized drift and volatility; bars land on
+    business days ending at ``end`` (default: the last weekday before today),
+    in the column layout ``get_stock_data`` returns. Pass another pandas
+    ``freq`` (e.g. ``'min'``) for series too long to fit in daily dates.
+    """
+    rng = np.random.default_rng(seed)
+    dt = 1 / 252
+    shocks = rng.normal((mu - 0.5 * sigma ** 2) * dt, sigma * np.sqrt(dt), size=bars)
+    close = start_price * np.exp(np.cumsum(shocks))
+    open_ = np.concatenate([[start_price], close[:-1]])
+    spread = np.abs(rng.normal(0, sigma * np.sqrt(dt) / 2, size=bars))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    volume = rng.lognormal(mean=15, sigma=0.4, size=bars).round()
+
+    end = pd.Timestamp(end) if end is not None else pd.Timestamp.today().normalize() - pd.offsets.BDay(1)
+    index = pd.date_range(end=end, periods=bars, freq=freq, name='date')
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume},
+                        index=index)
+
+
+def random_lstm(units=(50, 60, 80, 120), activation='relu', seed=0, dtype=np.float32):
+    """NumPy model with the notebook's architecture and random weights.
+
+    Stacked ``LSTM`` layers of ``units`` followed by ``Dense(1)``, initialized
+    the way Keras does by default (Glorot-uniform kernels, orthogonal
+    recurrent kernels, forget-gate bias 1). For benchmarks that must not
+    depend on a trained model being present.
+    """
+    rng = np.random.default_rng(seed)
+
+    def glorot(fan_in, fan_out):
+        limit = np.sqrt(6 / (fan_in + fan_out))
+        return rng.uniform(-limit, limit, size=(fan_in, fan_out)).astype(dtype)
+
+    def orthogonal(rows, cols):
+        q, r = np.linalg.qr(rng.normal(size=(cols, rows)))
+        return (q * np.sign(np.diag(r))).T.astype(dtype)
+
+    layers = []
+    features = 1
+    for position, size in enumerate(units):
+        bias = np.zeros(4 * size, dtype=dtype)
+        bias[size:2 * size] = 1.0
+        layers.append(LSTMLayer(glorot(features, 4 * size), orthogonal(size, 4 * size), bias,
+                                activation=activation,
+                                return_sequences=position < len(units) - 1))
+        features = size
+    layers.append(DenseLayer(glorot(features, 1), np.zeros(1, dtype=dtype)))
+    return NumpyLSTM(layers, dtype=dtype)
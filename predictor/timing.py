@@ -0,0 +1,60 @@
+import json
+import logging
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+
+from .config import TIMING_LOG
+
+logger = logging.getLogger('predictor.timing')
+
+
+def _configure(logger):
+    # One JSON object per line, to stderr or appended to PREDICTOR_TIMING_LOG;
+    # kept apart from Streamlit's own log formatting
+    if logger.handlers:
+        return logger
+    handler = logging.FileHandler(TIMING_LOG) if TIMING_LOG else logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+class StageTimer:
+    """Wall-clock spans for the stages of one script run.
+
+    Each finished span is kept for the in-app panel and logged right away as
+    a JSON line carrying the run id, ``context`` (e.g. the ticker) and any
+    per-span fields, so runs cut short by ``st.stop()`` still show up.
+    """
+
+    def __init__(self, **context):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.context = context
+        self.spans = []
+        self._log = _configure(logger)
+
+    @contextmanager
+    def span(self, stage, **fields):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, **fields)
+
+    def record(self, stage, seconds, **fields):
+        entry = {'stage': stage, 'ms': round(seconds * 1e3, 3), **fields}
+        self.spans.append(entry)
+        self._log.info(json.dumps({'ts': round(time.time(), 3), 'run': self.run_id,
+                                   **self.context, **entry}, default=str))
+
+    @property
+    def total(self):
+        return sum(entry['ms'] for entry in self.spans) / 1e3
+
+    def rows(self):
+        """Spans as records for ``st.dataframe``/``pd.DataFrame``."""
+        return [dict(entry) for entry in self.spans]
@@ -0,0 +1,29 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .config import WINDOW
+
+
+def make_windows(data, window=WINDOW, stride=1, dtype=None):
+    """Build LSTM inputs and next-step targets from a scaled series.
+
+    Equivalent to::
+
+        for i in range(window, len(data), stride):
+            x.append(data[i - window:i])
+            y.append(data[i, 0])
+
+    but ``x`` is a strided view of ``data`` rather than a copy, shaped
+    ``(n, window, 1)``. Passing ``dtype`` (e.g. ``np.float32``) makes one
+    contiguous copy in that dtype.
+    """
+    data = np.asarray(data).reshape(-1)
+    if len(data) <= window:
+        x = np.empty((0, window, 1), dtype=dtype or data.dtype)
+        return x, np.empty(0, dtype=dtype or data.dtype)
+    # The last window would have no target, so leave the final value out
+    x = sliding_window_view(data[:-1], window)[::stride, :, None]
+    y = data[window::stride]
+    if dtype is not None:
+        x, y = x.astype(dtype), y.astype(dtype)
+    return x, y
@@ -0,0 +1,163 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import sys
+import time
+import types
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .config import (INFERENCE_BACKEND, INFERENCE_THREADS, POOL_SIZE, QUANTIZATION,
+                     TF_INTER_OP_THREADS, TF_INTRA_OP_THREADS, WINDOW)
+
+# ------------------ Worker process side ------------------ #
+
+_model = None
+
+
+def _limit_threads(intra, inter):
+    # TensorFlow and OpenMP read these when they initialize, which in a
+    # worker happens after this point (the model is loaded below)
+    os.environ['TF_NUM_INTRAOP_THREADS'] = str(intra)
+    os.environ['TF_NUM_INTEROP_THREADS'] = str(inter)
+    os.environ['OMP_NUM_THREADS'] = str(intra)
+    try:
+        # NumPy's BLAS is already loaded; threadpoolctl (a scikit-learn
+        # dependency) can still resize its pool
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    threadpool_limits(intra)
+
+
+def _init_worker(path, backend, quantization, intra, inter):
+    global _model
+    _limit_threads(intra, inter)
+    if backend == 'keras':
+        import tensorflow as tf
+
+        tf.config.threading.set_intra_op_parallelism_threads(intra)
+        tf.config.threading.set_inter_op_parallelism_threads(inter)
+    from .inference import load_model
+
+    _model = load_model(path, backend=backend, num_threads=intra, quantization=quantization)
+    _model.predict(np.zeros((1, WINDOW, 1), dtype=np.float32), verbose=0)
+
+
+def _predict_shared(in_name, shape, out_name, out_width):
+    # Spawned workers report to the parent's resource tracker, so attaching
+    # here doesn't make the segments look leaked; the parent unlinks them
+    source, target = SharedMemory(in_name), SharedMemory(out_name)
+    try:
+        x = np.ndarray(shape, dtype=np.float32, buffer=source.buf)
+        y = np.ndarray((shape[0], out_width), dtype=np.float32, buffer=target.buf)
+        y[:] = np.asarray(_model.predict(x, verbose=0)).reshape(shape[0], out_width)
+        del x, y
+    finally:
+        source.close()
+        target.close()
+
+
+def _pid(delay):
+    # Held briefly so each worker takes some of start()'s probes
+    time.sleep(delay)
+    return os.getpid()
+
+
+# ------------------ Web tier side ------------------ #
+
+@contextlib.contextmanager
+def _bare_main():
+    # Spawned children re-run the parent's __main__ module. Under Streamlit
+    # that is the app script itself, so hide it while the workers start
+    main = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        yield
+    finally:
+        sys.modules['__main__'] = main
+
+
+class InferencePool:
+    """Model inference in a pool of worker processes.
+
+    Each worker loads the model once, with its TensorFlow intra/inter-op
+    and BLAS thread counts capped, so ``size`` workers don't oversubscribe
+    the cores. Windows go to a worker through a shared-memory segment
+    and predictions come back through another. Only the segment names are
+    pickled. ``submit`` returns a ``concurrent.futures.Future``, so Streamlit
+    threads, the micro-batcher and asyncio code (``predict_async``) can wait
+    on it without holding the GIL while the forward pass runs.
+    """
+
+    # Calls from many threads are fine: each job runs in its own process
+    thread_safe = True
+
+    def __init__(self, path, backend=None, size=None, intra_op_threads=None,
+                 inter_op_threads=None, quantization=None, out_width=1):
+        self.backend = backend or INFERENCE_BACKEND
+        self.size = size or POOL_SIZE or 1
+        cores = os.cpu_count() or 1
+        self.intra_op_threads = (intra_op_threads or TF_INTRA_OP_THREADS or INFERENCE_THREADS
+                                 or max(1, cores // self.size))
+        self.inter_op_threads = inter_op_threads or TF_INTER_OP_THREADS
+        self.out_width = out_width
+        quantization = quantization if quantization is not None else QUANTIZATION
+        # Spawned, not forked: the parent may hold TensorFlow or Streamlit threads
+        self._executor = ProcessPoolExecutor(
+            self.size, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(os.path.abspath(path), self.backend, quantization,
+                      self.intra_op_threads, self.inter_op_threads))
+
+    def start(self):
+        """Spawn and warm every worker; call before the first ``submit``.
+
+        The executor starts workers as jobs arrive; starting them all here,
+        while ``__main__`` is hidden, means none is spawned later.
+        """
+        pids = set()
+        with _bare_main():
+            while len(pids) < self.size:
+                pids.update(self._executor.map(_pid, [0.05] * self.size * 2))
+        return self
+
+    def submit(self, x):
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        source = SharedMemory(create=True, size=max(x.nbytes, 1))
+        target = SharedMemory(create=True, size=max(len(x) * self.out_width * 4, 1))
+        view = np.ndarray(x.shape, dtype=np.float32, buffer=source.buf)
+        view[:] = x
+        del view
+        result = Future()
+        result.set_running_or_notify_cancel()
+
+        def collect(job):
+            try:
+                job.result()
+                y = np.ndarray((len(x), self.out_width), dtype=np.float32, buffer=target.buf)
+                result.set_result(y.copy())
+                del y
+            except BaseException as e:
+                result.set_exception(e)
+            finally:
+                for segment in (source, target):
+                    segment.close()
+                    segment.unlink()
+
+        job = self._executor.submit(_predict_shared, source.name, x.shape, target.name,
+                                    self.out_width)
+        job.add_done_callback(collect)
+        return result
+
+    def predict(self, x, batch_size=None, verbose=0):
+        return self.submit(x).result()
+
+    async def predict_async(self, x):
+        return await asyncio.wrap_future(self.submit(x))
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
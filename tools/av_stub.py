@@ -0,0 +1,229 @@
+"""Offline stand-in for the Alpha Vantage time-series API.
+
+    python tools/av_stub.py [--port 8765] [--latency-ms 150 --jitter-ms 50]
+                            [--calls-per-minute 5] [--fixtures DIR]
+
+then run the app (or any fetch code) with
+
+    ALPHA_VANTAGE_BASE_URL=http://127.0.0.1:8765 ALPHA_VANTAGE_API_KEY=stub \\
+        streamlit run app.py
+
+Serves ``/query?function=TIME_SERIES_DAILY`` and
+``TIME_SERIES_INTRADAY`` in Alpha Vantage's JSON layout (``outputsize``
+compact = latest 100 bars, full = everything). Bars come from
+``--fixtures`` when the directory has ``<SYMBOL>.csv`` (date index plus
+Open/High/Low/Close/Volume, e.g. an exported OHLCV cache frame) or
+``<SYMBOL>.json`` (a recorded Alpha Vantage response); any other symbol
+gets a GBM series seeded from its name, so it is the same on every call.
+
+Calls beyond ``--calls-per-minute`` per API key (and a random
+``--throttle-probability`` share of all calls) get the service's throttling
+``Note`` payload instead of data. ``GET /stats`` reports call counts.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict, deque
+
+import pandas as pd
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.synthetic import gbm_ohlcv  # noqa: E402
+
+COMPACT_BARS = 100
+
+INTERVALS = ('1min', '5min', '15min', '30min', '60min')
+
+THROTTLE_NOTE = ("Thank you for using Alpha Vantage! Our standard API call frequency is "
+                 "{limit} calls per minute and 500 calls per day. Please visit "
+                 "https://www.alphavantage.co/premium/ if you would like to target a higher "
+                 "API call frequency.")
+
+INVALID_CALL = ("Invalid API call. Please retry or visit the documentation "
+                "(https://www.alphavantage.co/documentation/) for {function}.")
+
+FIELDS = (('1. open', 'Open'), ('2. high', 'High'), ('3. low', 'Low'),
+          ('4. close', 'Close'), ('5. volume', 'Volume'))
+
+
+def _frame_from_response(payload):
+    key = next(k for k in payload if k.startswith('Time Series'))
+    df = pd.DataFrame.from_dict(payload[key], orient='index').astype(float)
+    df = df.rename(columns=dict(FIELDS))[[column for _, column in FIELDS]]
+    df.index = pd.to_datetime(df.index)
+    return df.sort_index()
+
+
+def _time_series(df, date_format):
+    rows = {}
+    # Newest first, values as strings, like the real service
+    for stamp, bar in zip(df.index[::-1].strftime(date_format), df.to_numpy()[::-1]):
+        rows[stamp] = {'1. open': f'{bar[0]:.4f}', '2. high': f'{bar[1]:.4f}',
+                       '3. low': f'{bar[2]:.4f}', '4. close': f'{bar[3]:.4f}',
+                       '5. volume': f'{bar[4]:.0f}'}
+    return rows
+
+
+class AlphaVantageStub:
+    """State and request handlers behind the stub server."""
+
+    def __init__(self, fixtures=None, bars=6000, intraday_bars=2000, latency=0.0, jitter=0.0,
+                 calls_per_minute=0, throttle_probability=0.0, seed=0):
+        self.fixtures = fixtures
+        self.bars = bars
+        self.intraday_bars = intraday_bars
+        self.latency = latency
+        self.jitter = jitter
+        self.calls_per_minute = calls_per_minute
+        self.throttle_probability = throttle_probability
+        self.seed = seed
+        self.stats = Counter()
+        self.by_symbol = Counter()
+        self._frames = {}
+        self._calls = defaultdict(deque)
+        self._random = random.Random(seed)
+
+    def frame(self, symbol, freq='B'):
+        key = (symbol, freq)
+        if key not in self._frames:
+            self._frames[key] = self._load_fixture(symbol) if freq == 'B' else None
+            if self._frames[key] is None:
+                bars = self.bars if freq == 'B' else self.intraday_bars
+                seed = self.seed + zlib.crc32(f'{symbol}/{freq}'.encode())
+                self._frames[key] = gbm_ohlcv(bars, seed=seed, freq=freq)
+        return self._frames[key]
+
+    def _load_fixture(self, symbol):
+        if not self.fixtures:
+            return None
+        base = os.path.join(self.fixtures, symbol)
+        if os.path.exists(base + '.csv'):
+            df = pd.read_csv(base + '.csv', index_col=0, parse_dates=True)
+            return df[[column for _, column in FIELDS]].sort_index()
+        if os.path.exists(base + '.json'):
+            with open(base + '.json') as fh:
+                return _frame_from_response(json.load(fh))
+        return None
+
+    def _throttled(self, api_key):
+        if self.throttle_probability and self._random.random() < self.throttle_probability:
+            return True
+        if not self.calls_per_minute:
+            return False
+        now = time.monotonic()
+        calls = self._calls[api_key]
+        while calls and now - calls[0] >= 60:
+            calls.popleft()
+        if len(calls) >= self.calls_per_minute:
+            return True
+        calls.append(now)
+        return False
+
+    async def handle_query(self, request):
+        params = request.query
+        function = params.get('function', '')
+        symbol = params.get('symbol', '').upper()
+        self.stats['calls'] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter,
+                                                                             self.jitter)))
+        if self._throttled(params.get('apikey', '')):
+            self.stats['throttled'] += 1
+            return web.json_response({'Note': THROTTLE_NOTE.format(limit=self.calls_per_minute or 5)})
+
+        interval = params.get('interval', '')
+        if not symbol or function not in ('TIME_SERIES_DAILY', 'TIME_SERIES_INTRADAY') or (
+                function == 'TIME_SERIES_INTRADAY' and interval not in INTERVALS):
+            self.stats['errors'] += 1
+            return web.json_response({'Error Message': INVALID_CALL.format(function=function)})
+
+        outputsize = params.get('outputsize', 'compact')
+        self.stats[function] += 1
+        self.by_symbol[symbol] += 1
+        if function == 'TIME_SERIES_DAILY':
+            df = self.frame(symbol)
+            series_key, date_format = 'Time Series (Daily)', '%Y-%m-%d'
+            meta = {'1. Information': 'Daily Prices (open, high, low, close) and Volumes',
+                    '2. Symbol': symbol,
+                    '3. Last Refreshed': df.index[-1].strftime(date_format),
+                    '4. Output Size': outputsize.title(),
+                    '5. Time Zone': 'US/Eastern'}
+        else:
+            df = self.frame(symbol, interval)
+            series_key, date_format = f'Time Series ({interval})', '%Y-%m-%d %H:%M:%S'
+            meta = {'1. Information': f'Intraday ({interval}) open, high, low, close prices and volume',
+                    '2. Symbol': symbol,
+                    '3. Last Refreshed': df.index[-1].strftime(date_format),
+                    '4. Interval': interval,
+                    '5. Output Size': outputsize.title(),
+                    '6. Time Zone': 'US/Eastern'}
+        if outputsize != 'full':
+            df = df.tail(COMPACT_BARS)
+        return web.json_response({'Meta Data': meta, series_key: _time_series(df, date_format)})
+
+    async def handle_stats(self, request):
+        return web.json_response({**self.stats, 'by_symbol': dict(self.by_symbol)})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/query', self.handle_query)
+        app.router.add_get('/stats', self.handle_stats)
+        return app
+
+
+def serve_in_thread(stub, host='127.0.0.1', port=0):
+    """Run ``stub`` on a daemon thread; returns ``(base_url, stop)``.
+
+    ``port=0`` picks a free port. For harnesses that start the stub next to
+    the code under test.
+    """
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(stub.app(), access_log=None)
+
+    async def start():
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    threading.Thread(target=loop.run_forever, name='av-stub', daemon=True).start()
+    bound = asyncio.run_coroutine_threadsafe(start(), loop).result()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    return f'http://{host}:{bound}', stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', help='directory of <SYMBOL>.csv / <SYMBOL>.json bars')
+    parser.add_argument('--bars', type=int, default=6000, help='synthetic daily history length')
+    parser.add_argument('--intraday-bars', type=int, default=2000)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--calls-per-minute', type=int, default=0, help='per API key; 0 = no limit')
+    parser.add_argument('--throttle-probability', type=float, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    stub = AlphaVantageStub(fixtures=args.fixtures, bars=args.bars,
+                            intraday_bars=args.intraday_bars, latency=args.latency_ms / 1e3,
+                            jitter=args.jitter_ms / 1e3, calls_per_minute=args.calls_per_minute,
+                            throttle_probability=args.throttle_probability, seed=args.seed)
+    web.run_app(stub.app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
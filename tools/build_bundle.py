@@ -0,0 +1,60 @@
+"""Package a trained model with its fitted scaler into a serving bundle.
+
+    python tools/build_bundle.py --ticker AAPL --start 2015-03-01
+    python tools/build_bundle.py --csv aapl.csv --ticker AAPL
+
+The closes must be the series the model was trained on (the notebook uses
+AAPL from 2015-03-01); the scaler is refit on its first 70%, as in training.
+``--ticker`` alone reads the app's OHLCV cache (.cache/ohlcv).
+"""
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.bundle import build_bundle  # noqa: E402
+from predictor.config import BUNDLE_PATH, MODEL_PATH, WINDOW  # noqa: E402
+from predictor.ohlcv_cache import OHLCVCache  # noqa: E402
+
+
+def load_close(args):
+    if args.csv:
+        df = pd.read_csv(args.csv, index_col=0, parse_dates=True)
+    else:
+        df = OHLCVCache().load(args.ticker)
+        if df is None:
+            raise SystemExit(f"No cached bars for {args.ticker}; open it in the app first or pass --csv")
+    close = df['Close'].sort_index()
+    if args.start:
+        close = close[args.start:]
+    if args.end:
+        close = close[:args.end]
+    return close
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--out', default=BUNDLE_PATH)
+    parser.add_argument('--ticker', help='training ticker (also recorded in the bundle)')
+    parser.add_argument('--csv', help='CSV with a date index and a Close column')
+    parser.add_argument('--start')
+    parser.add_argument('--end')
+    parser.add_argument('--window', type=int, default=WINDOW)
+    parser.add_argument('--notes')
+    args = parser.parse_args()
+    if not (args.csv or args.ticker):
+        parser.error('pass --ticker and/or --csv')
+
+    meta = build_bundle(args.model, load_close(args), args.out, ticker=args.ticker,
+                        window=args.window, notes=args.notes)
+    print(f"wrote {args.out}")
+    print(json.dumps(meta, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Import-time budget for the Streamlit app's cold start.
+
+    python tools/check_import_time.py [--budget-ms 2500]
+
+Imports the modules in app.py's top import block (what runs before the first
+paint) under ``python -X importtime`` in a fresh interpreter. Fails
+if any heavy dependency sneaks in or the total goes over budget.
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must only load once the section that needs them runs
+DEFERRED = ('tensorflow', 'keras', 'sklearn', 'matplotlib', 'h5py')
+
+
+def top_level_imports(path):
+    with open(path, encoding='utf-8') as fh:
+        tree = ast.parse(fh.read())
+    modules = []
+    # The import block at the top; later imports run after the page has painted
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+        else:
+            break
+    return list(dict.fromkeys(modules))
+
+
+def measure(modules):
+    code = '; '.join(f'import {m}' for m in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode:
+        raise SystemExit(result.stderr)
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time:  self_us | cumulative_us | <indent>package"
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        timings.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', default=os.path.join(ROOT, 'app.py'))
+    parser.add_argument('--budget-ms', type=float, default=2500)
+    args = parser.parse_args()
+
+    modules = top_level_imports(args.app)
+    timings = measure(modules)
+    loaded = {name.strip() for name, _, _ in timings}
+    total_ms = sum(self_us for _, self_us, _ in timings) / 1000
+
+    print(f"cold-start imports: {', '.join(modules)}")
+    print("slowest top-level packages:")
+    roots = [t for t in timings if not t[0].startswith('  ')]
+    for name, _, cumulative_us in sorted(roots, key=lambda t: -t[2])[:10]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+    print(f"total: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    leaked = sorted(m for m in loaded if m.split('.')[0] in DEFERRED)
+    if leaked:
+        print(f"FAIL: deferred dependencies imported at cold start: {', '.join(leaked)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
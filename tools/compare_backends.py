@@ -0,0 +1,107 @@
+"""Parity, latency and memory of each inference backend on the same windows.
+
+    python tools/compare_backends.py [keras_model.keras] --backends keras numpy tflite onnx
+    python tools/compare_backends.py --backends keras numpy    # NumPy backend parity only
+
+Each backend runs in its own interpreter so import cost and peak RSS are
+measured in isolation. Predictions are compared against ``keras``; the
+script exits non-zero if any backend differs by more than ``--atol``.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def sample_windows(n, steps, seed=0):
+    # Random walks scaled to [0, 1], like the MinMax-scaled closes the app feeds in
+    rng = np.random.default_rng(seed)
+    walks = np.cumsum(rng.normal(size=(n, steps)), axis=1)
+    walks = (walks - walks.min(axis=1, keepdims=True)) / np.ptp(walks, axis=1, keepdims=True)
+    return walks[:, :, None].astype(np.float32)
+
+
+def rss_mb():
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(args):
+    start = time.perf_counter()
+    from predictor.inference import load_model
+
+    model = load_model(args.model, backend=args.worker, num_threads=args.threads)
+    load_s = time.perf_counter() - start
+
+    x = np.load(args.windows)
+    model.predict(x[:1], verbose=0)  # warm-up / graph tracing
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        y = np.asarray(model.predict(x, verbose=0))
+        timings.append(time.perf_counter() - start)
+    np.save(args.out, y)
+    print(json.dumps({'load_s': load_s, 'predict_s': float(np.median(timings)), 'rss_mb': rss_mb()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('model', nargs='?', default='keras_model.keras')
+    parser.add_argument('--backends', nargs='+', default=['keras', 'numpy', 'tflite', 'onnx'])
+    parser.add_argument('--windows', default=None)
+    parser.add_argument('--n', type=int, default=1024)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--atol', type=float, default=1e-4)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        return run_worker(args)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        windows = os.path.join(tmp, 'windows.npy')
+        np.save(windows, sample_windows(args.n, args.steps))
+        stats, outputs = {}, {}
+        failed = False
+        for backend in args.backends:
+            out = os.path.join(tmp, f'{backend}.npy')
+            cmd = [sys.executable, __file__, args.model, '--worker', backend, '--windows', windows,
+                   '--out', out, '--repeat', str(args.repeat)]
+            if args.threads:
+                cmd += ['--threads', str(args.threads)]
+            result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+            if result.returncode:
+                failed = True
+                print(f"{backend}: failed\n{(result.stderr.strip().splitlines() or [''])[-1]}")
+                continue
+            stats[backend] = json.loads(result.stdout.strip().splitlines()[-1])
+            outputs[backend] = np.load(out)
+
+    reference = outputs.get('keras')
+    if reference is None:
+        # Nothing to check the other backends against
+        failed = True
+        print("keras reference missing: parity not checked")
+    print(f"{args.n} windows x {args.steps} steps, median of {args.repeat}")
+    print(f"{'backend':>8} {'load':>8} {'predict':>9} {'win/s':>9} {'peak RSS':>9} {'max diff':>9}")
+    for backend, s in stats.items():
+        diff = float(np.abs(outputs[backend] - reference).max()) if reference is not None else float('nan')
+        failed |= diff > args.atol
+        print(f"{backend:>8} {s['load_s']:>7.2f}s {s['predict_s'] * 1e3:>7.1f}ms "
+              f"{args.n / s['predict_s']:>9,.0f} {s['rss_mb']:>7.0f}MB {diff:>9.1e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Export the trained Keras LSTM to TFLite and/or ONNX for CPU serving.
+
+    python tools/export_model.py [keras_model.keras] --format tflite onnx
+    python tools/export_model.py --format tflite --quantize int8 float16
+
+Writes ``<model>.tflite`` / ``<model>.onnx`` next to the input unless
+``--out-dir`` is given. Needs TensorFlow (and tf2onnx for ONNX); the web
+process only needs the matching runtime.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.config import MODEL_PATH, WINDOW  # noqa: E402
+from predictor.inference import TFLITE_BATCH, exported_path  # noqa: E402
+from predictor.quantize import MODES  # noqa: E402
+
+
+def export_tflite(model, out_path, batch_size=TFLITE_BATCH, window=WINDOW, quantize=None):
+    """Convert ``model`` to a TFLite flatbuffer with a fixed batch dimension.
+
+    The recurrent loop only lowers to builtin ops (no Flex delegate) when
+    every shape is static, so the graph is exported for ``batch_size``
+    windows; ``TFLiteModel`` pads and chunks to that at runtime.
+
+    ``quantize='int8'`` is dynamic-range quantization (int8 weights, float
+    activations); ``'float16'`` stores float16 weights. Neither quantizes
+    activations, so no representative dataset is needed.
+    """
+    import tensorflow as tf
+
+    spec = [tf.TensorSpec((batch_size, window, 1), tf.float32, name='input')]
+    with tempfile.TemporaryDirectory() as saved_model:
+        model.export(saved_model, format='tf_saved_model', input_signature=spec, verbose=False)
+        converter = tf.lite.TFLiteConverter.from_saved_model(saved_model)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+        if quantize:
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if quantize == 'float16':
+            converter.target_spec.supported_types = [tf.float16]
+        flatbuffer = converter.convert()
+    with open(out_path, 'wb') as fh:
+        fh.write(flatbuffer)
+    return out_path
+
+
+def export_onnx(model, out_path, window=WINDOW, opset=13):
+    import tensorflow as tf
+    import tf2onnx
+
+    spec = [tf.TensorSpec((None, window, 1), tf.float32, name='input')]
+    # Trace the call as a tf.function; from_keras does not handle Keras 3 models
+    forward = tf.function(lambda x: model(x, training=False))
+    tf2onnx.convert.from_function(forward, input_signature=spec, opset=opset, output_path=out_path)
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('model', nargs='?', default=MODEL_PATH)
+    parser.add_argument('--format', nargs='+', choices=('tflite', 'onnx'), default=['tflite', 'onnx'])
+    parser.add_argument('--out-dir')
+    parser.add_argument('--window', type=int, default=WINDOW)
+    parser.add_argument('--tflite-batch', type=int, default=TFLITE_BATCH,
+                        help='fixed batch size baked into the TFLite graph')
+    parser.add_argument('--quantize', nargs='+', choices=MODES, default=[],
+                        help='also write quantized TFLite variants')
+    args = parser.parse_args()
+
+    from keras.models import load_model
+
+    model = load_model(args.model)
+    for fmt in args.format:
+        out_path = exported_path(args.model, fmt)
+        if args.out_dir:
+            os.makedirs(args.out_dir, exist_ok=True)
+            out_path = os.path.join(args.out_dir, os.path.basename(out_path))
+        if fmt == 'tflite':
+            export_tflite(model, out_path, batch_size=args.tflite_batch, window=args.window)
+        else:
+            export_onnx(model, out_path, window=args.window)
+        print(f"wrote {out_path} ({os.path.getsize(out_path) / 1024:.0f} KiB)")
+        if fmt != 'tflite':
+            continue
+        for mode in args.quantize:
+            variant_path = os.path.join(os.path.dirname(out_path),
+                                        os.path.basename(exported_path(args.model, fmt, mode)))
+            export_tflite(model, variant_path, batch_size=args.tflite_batch, window=args.window,
+                          quantize=mode)
+            print(f"wrote {variant_path} ({os.path.getsize(variant_path) / 1024:.0f} KiB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""Load test: many concurrent headless sessions of app.py against the stub.
+
+    python tools/load_test.py [--concurrency 1 2 4 8 16] [--duration 30] [--workers 1]
+
+Starts tools/av_stub.py in-process, then for each concurrency level spawns
+``--workers`` worker processes. Each worker stands in for one
+``streamlit run app.py`` server process: its session threads share the
+model registry, render cache and fetch scheduler, the way sessions of one
+dyno do. Every session thread loops over a fresh Streamlit ``AppTest``
+session: open the page, enter a random ticker from ``--tickers``, press
+Fetch and wait for the full page run. That last run is the page latency.
+
+Reported per level: p50/p95/p99 page latency, pages/s across all workers,
+errors, and per-worker CPU (share of one core, so threads can exceed 100%)
+and RSS. AppTest executes the real script but not Streamlit's websocket
+layer, so browser-side delta rendering is not part of the numbers.
+
+All workers share one OHLCV cache directory (fresh per run unless
+``--cache-dir`` is given). The first fetch of each ticker therefore goes
+to the stub and later ones are incremental, as in production.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TOOLS)
+APP = os.path.join(ROOT, 'app.py')
+
+TICKERS = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'IBM', 'ORCL', 'INTC',
+           'AMD', 'NFLX', 'ADBE', 'CRM', 'CSCO', 'QCOM', 'TXN', 'AVGO', 'PYPL', 'UBER']
+
+# st.error messages app.py shows when a page fails; it also uses st.error for
+# the "Strong Downtrend" signal, which is a normal page
+FAILURE_MESSAGES = ('Error fetching stock data', 'No data found', 'Error loading model',
+                    'Alpha Vantage API key not found')
+
+
+def rss_mb():
+    with open('/proc/self/statm') as fh:
+        return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+# ------------------ Worker process ------------------ #
+
+def page_run(tickers, rng, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=timeout)
+    app.run()
+    app.text_input[0].set_value(rng.choice(tickers))
+    app.button[0].click()
+    start = time.perf_counter()
+    app.run()
+    latency = time.perf_counter() - start
+    failed = bool(app.exception) or any(
+        message in error.value for error in app.error for message in FAILURE_MESSAGES)
+    return latency, failed
+
+
+def session_loop(seed, tickers, deadline, timeout, latencies, errors):
+    rng = random.Random(seed)
+    while time.monotonic() < deadline:
+        try:
+            latency, failed = page_run(tickers, rng, timeout)
+        except Exception:
+            errors.append(1)
+            continue
+        # Runs still in flight when the window closes are not counted
+        if time.monotonic() <= deadline:
+            latencies.append(latency)
+            if failed:
+                errors.append(1)
+
+
+def run_worker(args):
+    tickers = args.tickers
+    # Warm-up outside the timed window: imports, model load, first render
+    page_run(tickers, random.Random(-1), args.timeout)
+
+    latencies, errors = [], []
+    peak = [rss_mb()]
+    cpu_start, wall_start = cpu_seconds(), time.monotonic()
+    deadline = wall_start + args.duration
+    threads = [threading.Thread(target=session_loop,
+                                args=(args.seed * 1000 + i, tickers, deadline, args.timeout,
+                                      latencies, errors))
+               for i in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        peak[0] = max(peak[0], rss_mb())
+        time.sleep(0.5)
+    wall = time.monotonic() - wall_start
+    print(json.dumps({'latencies': latencies, 'errors': len(errors), 'wall_s': wall,
+                      'cpu_percent': 100 * (cpu_seconds() - cpu_start) / wall,
+                      'rss_mb': rss_mb(), 'peak_rss_mb': peak[0]}))
+
+
+# ------------------ Driver ------------------ #
+
+def spawn_workers(level, args, env):
+    procs = []
+    for worker in range(args.workers):
+        cmd = [sys.executable, os.path.abspath(__file__), '--worker',
+               '--concurrency', str(level), '--duration', str(args.duration),
+               '--timeout', str(args.timeout), '--seed', str(worker + 1),
+               '--tickers', *args.tickers]
+        procs.append(subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True))
+    results = []
+    for proc in procs:
+        out, _ = proc.communicate()
+        if proc.returncode != 0:
+            raise SystemExit(f"worker exited with {proc.returncode}")
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    return results
+
+
+def report(level, results):
+    latencies = np.array([value for result in results for value in result['latencies']])
+    pages = len(latencies)
+    wall = max(result['wall_s'] for result in results)
+    errors = sum(result['errors'] for result in results)
+    if pages:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+    else:
+        p50 = p95 = p99 = float('nan')
+    print(f"{level:>6} {pages:>6} {pages / wall:>8.2f} {p50:>8.0f} {p95:>8.0f} {p99:>8.0f} {errors:>6}  "
+          + '  '.join(f"w{i}: {r['cpu_percent']:.0f}% {r['peak_rss_mb']:.0f}MB"
+                      for i, r in enumerate(results)))
+    return {'concurrency': level, 'pages': pages, 'pages_per_second': pages / wall,
+            'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99, 'errors': errors,
+            'workers': [{key: r[key] for key in ('cpu_percent', 'rss_mb', 'peak_rss_mb')}
+                        for r in results]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16],
+                        help='concurrent sessions per worker, one level after another')
+    parser.add_argument('--workers', type=int, default=1, help='server processes per level')
+    parser.add_argument('--duration', type=float, default=30, help='timed seconds per level')
+    parser.add_argument('--tickers', nargs='+', default=TICKERS)
+    parser.add_argument('--timeout', type=float, default=120, help='per page run')
+    parser.add_argument('--latency-ms', type=float, default=150, help='stub response latency')
+    parser.add_argument('--jitter-ms', type=float, default=50)
+    parser.add_argument('--calls-per-minute', type=float, default=6000,
+                        help="the app's fetch budget; the real plan's 5 makes fetches queue")
+    parser.add_argument('--cache-dir')
+    parser.add_argument('--json', help='also write the results here')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        args.concurrency = args.concurrency[0]
+        return run_worker(args)
+
+    sys.path.insert(0, TOOLS)
+    from av_stub import AlphaVantageStub, serve_in_thread
+
+    stub = AlphaVantageStub(latency=args.latency_ms / 1e3, jitter=args.jitter_ms / 1e3,
+                            seed=args.seed)
+    base_url, stop = serve_in_thread(stub)
+    cache_dir = args.cache_dir or tempfile.mkdtemp(prefix='load-test-')
+    env = dict(os.environ, ALPHA_VANTAGE_BASE_URL=base_url, ALPHA_VANTAGE_API_KEY='load-test',
+               ALPHA_VANTAGE_CALLS_PER_MINUTE=str(args.calls_per_minute),
+               ALPHA_VANTAGE_API_CALLS_PER_MINUTE='0',
+               PREDICTOR_CACHE_DIR=cache_dir, PREDICTOR_TIMING_LOG=os.devnull)
+
+    print(f"stub at {base_url}, {args.workers} worker(s), {args.duration:.0f}s per level")
+    print(f"{'conc':>6} {'pages':>6} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}  per worker")
+    rows = []
+    try:
+        for level in args.concurrency:
+            rows.append(report(level, spawn_workers(level, args, env)))
+    finally:
+        stop()
+        if not args.cache_dir:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+    print(f"stub served {stub.stats['calls']} calls")
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(rows, fh, indent=1)
+
+
+if __name__ == '__main__':
+    main()
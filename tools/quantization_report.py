@@ -0,0 +1,99 @@
+"""Accuracy vs memory/latency of the quantized model variants.
+
+    python tools/quantization_report.py --ticker AAPL --start 2015-03-01
+    python tools/quantization_report.py --csv aapl.csv
+    python tools/quantization_report.py            # synthetic GBM closes
+
+Follows the notebook's pipeline: the scaler is fitted on the first 70% of
+the closes and the report scores the hold-out 30% (RMSE/MAPE in price
+units). Each variant is compared with the float32 NumPy model. TFLite rows
+appear for whichever exports from tools/export_model.py exist.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from predictor.config import MODEL_PATH  # noqa: E402
+from predictor.inference import exported_path, load_model  # noqa: E402
+from predictor.ohlcv_cache import OHLCVCache  # noqa: E402
+from predictor.pipeline import prepare_test_windows  # noqa: E402
+from predictor.quantize import MODES, weight_nbytes  # noqa: E402
+from predictor.synthetic import gbm_ohlcv  # noqa: E402
+
+
+def load_close(args):
+    if args.csv:
+        close = pd.read_csv(args.csv, index_col=0, parse_dates=True)['Close']
+    elif args.ticker:
+        df = OHLCVCache().load(args.ticker)
+        if df is None:
+            raise SystemExit(f"No cached bars for {args.ticker}; open it in the app first or pass --csv")
+        close = df['Close']
+    else:
+        close = gbm_ohlcv(args.bars, seed=args.seed)['Close']
+    close = close.sort_index()
+    return close[args.start:] if args.start else close
+
+
+def variants(model_path):
+    yield 'numpy float32', 'numpy', None
+    for mode in MODES:
+        yield f'numpy {mode}', 'numpy', mode
+    if os.path.exists(exported_path(model_path, 'tflite')):
+        yield 'tflite float32', 'tflite', None
+    for mode in MODES:
+        if os.path.exists(exported_path(model_path, 'tflite', mode)):
+            yield f'tflite {mode}', 'tflite', mode
+
+
+def footprint(model, backend, model_path, mode):
+    if backend == 'numpy':
+        return weight_nbytes(model)
+    return os.path.getsize(exported_path(model_path, 'tflite', mode))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--ticker')
+    parser.add_argument('--csv')
+    parser.add_argument('--start')
+    parser.add_argument('--bars', type=int, default=2500, help='synthetic series length')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    close = load_close(args)
+    x, y, _, scaler = prepare_test_windows(close)
+    actual = scaler.inverse_transform(y).reshape(-1)
+    print(f"{len(close)} closes, {len(x)} hold-out windows")
+    print(f"{'variant':>15} {'RMSE':>9} {'MAPE':>8} {'dRMSE':>9} {'max|dy|':>9} {'weights':>9} {'latency':>9}")
+
+    baseline = None
+    for name, backend, mode in variants(args.model):
+        model = load_model(args.model, backend=backend, quantization=mode or '')
+        model.predict(x[:1])
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            raw = np.asarray(model.predict(x)).reshape(-1)
+            timings.append(time.perf_counter() - start)
+        predicted = scaler.inverse_transform(raw)
+        rmse = float(np.sqrt(np.mean((predicted - actual) ** 2)))
+        mape = float(np.mean(np.abs((predicted - actual) / actual)) * 100)
+        if baseline is None:
+            baseline = (rmse, predicted)
+        size = footprint(model, backend, args.model, mode)
+        print(f"{name:>15} {rmse:>9.4f} {mape:>7.3f}% {rmse - baseline[0]:>+9.4f} "
+              f"{np.abs(predicted - baseline[1]).max():>9.4f} {size / 1024:>7.0f}KB "
+              f"{np.median(timings) * 1e3:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
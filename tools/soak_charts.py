@@ -0,0 +1,106 @@
+"""Memory soak test for chart rendering.
+
+    python tools/soak_charts.py [--reruns 1000] [--mode charts|app]
+
+``charts`` renders all six app charts per rerun with the render cache out
+of the way; ``app`` drives full reruns of app.py through Streamlit's
+AppTest against synthetic cached data (slower). Fails if RSS after the
+warm-up grows by more than ``--max-growth-mb``.
+"""
+import argparse
+import gc
+import os
+import resource
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def rss_mb():
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        # Peak rather than current RSS, but still catches steady growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def chart_rerun(df):
+    from predictor import charts
+    from predictor.pipeline import moving_averages
+    from predictor.render_cache import figure_bytes
+
+    close = df['Close']
+    ma100, ma200 = moving_averages(close)
+    figures = [
+        charts.line_chart('Closing Price', close),
+        charts.moving_average_chart(close, '100-Day', [(ma100, '100-Day MA', 'red')]),
+        charts.moving_average_chart(close, '200-Day', [(ma200, '200-Day MA', 'blue')]),
+        charts.moving_average_chart(close, 'Combined', [(ma100, '100-Day MA', 'red'),
+                                                        (ma200, '200-Day MA', 'blue')]),
+        charts.prediction_chart(close.to_numpy()[-1500:], close.to_numpy()[-1500:] * 1.01),
+        charts.volume_chart(df['Volume']),
+    ]
+    for fig in figures:
+        figure_bytes(fig)
+
+
+def make_app_rerun(df, cache_dir):
+    # Empty render cache so every rerun rasterizes; data served from a fresh OHLCV cache
+    os.environ.update(ALPHA_VANTAGE_API_KEY='soak', PREDICTOR_CACHE_DIR=cache_dir,
+                      PREDICTOR_RENDER_CACHE_MB='0')
+    from streamlit.testing.v1 import AppTest
+
+    from predictor.ohlcv_cache import OHLCVCache
+
+    OHLCVCache(cache_dir).save('AAPL', df)
+    app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+    app.run()
+
+    def rerun():
+        app.button[0].click()
+        app.run()
+        if app.exception:
+            raise SystemExit(app.exception[0].message)
+    return rerun
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--bars', type=int, default=6000)
+    parser.add_argument('--mode', choices=('charts', 'app'), default='charts')
+    parser.add_argument('--max-growth-mb', type=float, default=25)
+    args = parser.parse_args()
+
+    from predictor.synthetic import gbm_ohlcv
+
+    df = gbm_ohlcv(args.bars)
+    cache_dir = tempfile.mkdtemp(prefix='soak-')
+    try:
+        rerun = make_app_rerun(df, cache_dir) if args.mode == 'app' else (lambda: chart_rerun(df))
+        for _ in range(args.warmup):
+            rerun()
+        gc.collect()
+        baseline = rss_mb()
+        print(f"after {args.warmup} warm-up reruns: {baseline:.0f} MB")
+        step = max(args.reruns // 10, 1)
+        for i in range(1, args.reruns + 1):
+            rerun()
+            if i % step == 0:
+                print(f"rerun {i:>5}: {rss_mb():.0f} MB")
+        gc.collect()
+        growth = rss_mb() - baseline
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"growth over {args.reruns} reruns: {growth:+.1f} MB (limit {args.max_growth_mb:.0f} MB)")
+    return 1 if growth > args.max_growth_mb else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())